@@ -0,0 +1,11 @@
+"""
+Compatibility shims for the range of Python versions Snail Core supports.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
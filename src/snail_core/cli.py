@@ -169,7 +169,7 @@ def collect(
     # Handle output
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(report.to_json())
+        output.write_text(report.to_json(), encoding="utf-8")
         console.print(f"\n[dim]Report saved to: {output}[/]")
     elif format == "json":
         console.print()
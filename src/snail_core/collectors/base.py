@@ -5,12 +5,50 @@ Base collector class that all collectors inherit from.
 from __future__ import annotations
 
 import logging
+import os
+import re
 import subprocess
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Characters that may wrap a value in key=value files
+_QUOTES = "\"'"
+
+
+@lru_cache(maxsize=None)
+def _kv_pattern(separator: str) -> re.Pattern[str]:
+    """
+    Compile the line regex used by parse_key_value_file for a separator.
+
+    Each match is one non-comment line split on its first separator, with
+    whitespace around the key and value already trimmed.
+    """
+    sep = re.escape(separator)
+    return re.compile(
+        rf"^[^\S\n]*((?:(?!{sep})[^#\s][^\n]*?)?)[^\S\n]*{sep}[^\S\n]*(.*?)[^\S\n]*$",
+        re.MULTILINE,
+    )
+
+
+def _split_lines(content: str) -> list[str]:
+    """Split file contents into lines the way read_file_lines does."""
+    return content.strip().split("\n") if content else []
+
+
+def _parse_key_values(content: str, separator: str, strip_quotes: bool) -> dict[str, str]:
+    """Parse key-value pairs out of file contents already in memory."""
+    result = {}
+    # One regex sweep over the whole file instead of a Python loop per line
+    for match in _kv_pattern(separator).finditer(content):
+        key, value = match.groups()
+        if strip_quotes and len(value) >= 2 and value[0] == value[-1] and value[0] in _QUOTES:
+            value = value[1:-1]
+        result[key] = value
+    return result
+
 
 class BaseCollector(ABC):
     """
@@ -25,6 +63,9 @@ class BaseCollector(ABC):
 
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.{self.name}")
+        # Readability of paths already probed. SnailCore builds a new collector
+        # for every run, so answers never carry over from an earlier collection.
+        self._readable_cache: dict[str, bool] = {}
 
     @abstractmethod
     def collect(self) -> dict[str, Any]:
@@ -82,19 +123,50 @@ class BaseCollector(ABC):
         Returns:
             File contents or default value.
         """
+        # Missing or unreadable paths are common; skip raising and unwinding OSError
+        if not path or not self._is_readable(path):
+            self.logger.debug(f"Could not read {path}: not readable")
+            return default
         try:
             with open(path) as f:
+                # A bare read() goes through FileIO.readall(), which sizes its
+                # buffer from fstat; open()'s buffering doesn't change this
+                return f.read()
+        except OSError as e:
+            self.logger.debug(f"Could not read {path}: {e}")
+            return default
+
+    def read_file_bytes(self, path: str, default: bytes = b"") -> bytes:
+        """
+        Read a file and return its raw contents without decoding.
+
+        Args:
+            path: Path to the file.
+            default: Default value if file cannot be read.
+
+        Returns:
+            File contents or default value.
+        """
+        if not path or not self._is_readable(path):
+            self.logger.debug(f"Could not read {path}: not readable")
+            return default
+        try:
+            with open(path, "rb") as f:
                 return f.read()
         except OSError as e:
             self.logger.debug(f"Could not read {path}: {e}")
             return default
 
+    def _is_readable(self, path: str) -> bool:
+        """Check whether a path is readable, remembering the answer for this run."""
+        readable = self._readable_cache.get(path)
+        if readable is None:
+            readable = self._readable_cache[path] = os.access(path, os.R_OK)
+        return readable
+
     def read_file_lines(self, path: str) -> list[str]:
         """Read a file and return lines as list."""
-        content = self.read_file(path)
-        if content:
-            return content.strip().split("\n")
-        return []
+        return _split_lines(self.read_file(path))
 
     def parse_key_value_file(
         self,
@@ -113,22 +185,7 @@ class BaseCollector(ABC):
         Returns:
             Dictionary of key-value pairs.
         """
-        result = {}
-        for line in self.read_file_lines(path):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if separator in line:
-                key, _, value = line.partition(separator)
-                key = key.strip()
-                value = value.strip()
-                if strip_quotes and len(value) >= 2:
-                    if (value.startswith('"') and value.endswith('"')) or (
-                        value.startswith("'") and value.endswith("'")
-                    ):
-                        value = value[1:-1]
-                result[key] = value
-        return result
+        return _parse_key_values(self.read_file(path), separator, strip_quotes)
 
     def detect_distro(self) -> dict[str, str]:
         """
@@ -6,13 +6,29 @@ Supports configuration via YAML files, environment variables, and programmatic a
 
 from __future__ import annotations
 
+import json
 import os
+import re
+import tempfile
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
 import yaml
 
+from snail_core._compat import DATACLASS_SLOTS
+
+try:
+    # libyaml-backed loader and dumper are several times faster when available
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_PATHS = [
     Path("/etc/snail-core/config.yaml"),
     Path.home() / ".config" / "snail-core" / "config.yaml",
@@ -20,7 +36,328 @@ DEFAULT_CONFIG_PATHS = [
 ]
 
 
-@dataclass
+# Environment variable spellings read as True; anything else is False
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable string as a boolean."""
+    return value.lower() in _TRUTHY
+
+
+# Environment variable overrides: (variable name, Config attribute, type coercer)
+_ENV_MAP: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("SNAIL_UPLOAD_URL", "upload_url", str),
+    ("SNAIL_UPLOAD_ENABLED", "upload_enabled", _to_bool),
+    ("SNAIL_UPLOAD_TIMEOUT", "upload_timeout", int),
+    ("SNAIL_API_KEY", "api_key", str),
+    ("SNAIL_AUTH_CERT", "auth_cert_path", str),
+    ("SNAIL_AUTH_KEY", "auth_key_path", str),
+    ("SNAIL_OUTPUT_DIR", "output_dir", str),
+    ("SNAIL_LOG_LEVEL", "log_level", str),
+    ("SNAIL_LOG_FILE", "log_file", str),
+)
+
+
+# Nested config file layout: (section, key, Config attribute), in to_dict() order
+_NESTED_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("upload", "url", "upload_url"),
+    ("upload", "enabled", "upload_enabled"),
+    ("upload", "timeout", "upload_timeout"),
+    ("upload", "retries", "upload_retries"),
+    ("auth", "api_key", "api_key"),
+    ("auth", "cert_path", "auth_cert_path"),
+    ("auth", "key_path", "auth_key_path"),
+    ("collection", "enabled_collectors", "enabled_collectors"),
+    ("collection", "disabled_collectors", "disabled_collectors"),
+    ("collection", "timeout", "collection_timeout"),
+    ("output", "dir", "output_dir"),
+    ("output", "keep_local", "keep_local_copy"),
+    ("output", "compress", "compress_output"),
+    ("logging", "level", "log_level"),
+    ("logging", "file", "log_file"),
+    ("privacy", "anonymize_hostnames", "anonymize_hostnames"),
+    ("privacy", "redact_passwords", "redact_passwords"),
+    ("privacy", "exclude_paths", "exclude_paths"),
+)
+
+# Reverse lookup used by from_dict() to flatten nested files
+_NESTED_TO_FLAT = {(section, key): attr for section, key, attr in _NESTED_FIELDS}
+
+# The same table grouped by section, in file order, for to_dict()
+_NESTED_SECTIONS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = tuple(
+    (section, tuple((key, attr) for s, key, attr in _NESTED_FIELDS if s == section))
+    for section in dict.fromkeys(section for section, _, _ in _NESTED_FIELDS)
+)
+
+
+# Prefix before a block value: sequence dashes, explicit "? "/": " markers, "key: "
+_VALUE_START_RE = re.compile(
+    r"""^(?:[-?:]\s+)*(?:(?:"[^"]*"|'[^']*'|[^\s#"'\[{][^#]*?)\s*:(?:\s+|$))?"""
+)
+
+
+def _find_unclosed_flow(text: str) -> int | None:
+    """
+    Cheaply detect a flow collection ([...] or {...}) that is never closed.
+
+    Only collections opened where YAML expects a value are tracked, and
+    comments, quoted strings and scalar continuation lines are skipped, so
+    valid documents are never flagged. PyYAML remains the authoritative
+    parser for everything else.
+
+    Returns:
+        1-based line number where the unclosed collection starts, or None.
+    """
+    depth = 0
+    flow_start = 0
+    scalar_indent = -1
+    quote = ""
+    escaped = False
+    last = ","
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+
+        if depth == 0:
+            if scalar_indent >= 0:
+                if not stripped or indent > scalar_indent:
+                    continue  # Continuation of a multi-line or block scalar
+                scalar_indent = -1
+            if not stripped or stripped.startswith("#"):
+                continue
+            match = _VALUE_START_RE.match(stripped)
+            rest = stripped[match.end() :] if match else stripped
+            if not rest or rest.startswith("#"):
+                continue  # Value is a nested block on the following lines
+            if rest[0] not in "[{":
+                # Scalar value; more-indented lines that follow belong to it
+                scalar_indent = indent
+                continue
+            flow_start = lineno
+            chars = rest
+            quote = ""
+            escaped = False
+            last = ","
+        else:
+            chars = line
+
+        prev = " "
+        for char in chars:
+            if quote:
+                if escaped:
+                    escaped = False
+                elif char == "\\" and quote == '"':
+                    escaped = True
+                elif char == quote:
+                    quote = ""
+                    if char == "'":
+                        char = "''"  # Marker so an escaped '' reopens the scalar
+            elif char == "'" and prev == "''":
+                quote = char
+            elif char in "'\"" and last in "[{,:?":
+                quote = char  # Quotes only open a scalar at its first character
+            elif char == "#" and prev in " \t":
+                break  # Comment runs to end of line
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if depth == 0:
+                    break
+            prev = char
+            if not char.isspace():
+                last = char
+
+    return flow_start if depth > 0 else None
+
+
+# One top-level "key: value" line of a flat config file
+_FLAT_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*):(?: +(.*))?")
+_DECIMAL_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_SCALAR_RESOLVER = yaml.resolver.Resolver()
+_NOT_FLAT = object()
+
+
+def _flat_scalar(value: str) -> Any:
+    """Type a plain or simply-quoted scalar as PyYAML would, or return _NOT_FLAT."""
+    if not value:
+        return None
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        return _NOT_FLAT if value[0] in inner or "\\" in inner else inner
+    if value[0] in "?:,[]{}#&*!|>'\"%@`" or (value[0] == "-" and value[1:2] in ("", " ")):
+        return _NOT_FLAT
+    if ": " in value or " #" in value or value.endswith(":"):
+        return _NOT_FLAT
+
+    tag = _SCALAR_RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+    if tag == "tag:yaml.org,2002:str":
+        return value
+    if tag == "tag:yaml.org,2002:null":
+        return None
+    if tag == "tag:yaml.org,2002:bool":
+        return value.lower() in ("yes", "true", "on")
+    if tag == "tag:yaml.org,2002:int" and _DECIMAL_RE.fullmatch(value):
+        return int(value)
+    return _NOT_FLAT  # Floats, dates, octal/hex/sexagesimal ints
+
+
+def _parse_flat(text: str) -> dict[str, Any] | None:
+    """
+    Parse a config made only of top-level "key: scalar" lines without PyYAML.
+
+    Keys and values are typed with PyYAML's own implicit resolver, so the
+    result matches a full parse. Anything beyond that subset (indentation,
+    flow collections, trailing comments, anchors, tags, floats, dates...)
+    returns None and is left to PyYAML.
+    """
+    if "\t" in text or yaml.reader.Reader.NON_PRINTABLE.search(text):
+        return None
+    data: dict[str, Any] = {}
+    for line in text.splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        match = _FLAT_LINE_RE.fullmatch(line.rstrip(" "))
+        if match is None:
+            return None
+        key, value = match.groups()
+        if _flat_scalar(key) != key:
+            return None  # e.g. "true:" or "null:" keys, which YAML doesn't read as strings
+        value = _flat_scalar(value or "")
+        if value is _NOT_FLAT:
+            return None
+        data[key] = value
+    return data
+
+
+class _FrozenList(tuple):
+    """A list from a cached document; from_dict turns it back into a list."""
+
+    __slots__ = ()
+
+
+def _freeze(value: Any) -> Any:
+    """Make a parsed document read-only so caches can hand it out without copying."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Undo _freeze, giving the caller its own mutable copy; other values pass through."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, _FrozenList):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml_cached(text: str) -> Mapping[str, Any]:
+    """Parse YAML text into a frozen document, memoized on the exact document text."""
+    flat = _parse_flat(text)
+    if flat is not None:
+        return _freeze(flat)
+    unclosed = _find_unclosed_flow(text)
+    if unclosed is not None:
+        # Fail fast on obviously broken files without a full parse
+        raise yaml.YAMLError(f"Unclosed flow collection starting on line {unclosed}")
+    return _freeze(yaml.load(text, Loader=_SafeLoader) or {})
+
+
+# Parsed config files by resolved path: ((mtime_ns, size, inode), frozen document)
+_FILE_CACHE: dict[Path, tuple[tuple[int, int, int], Mapping[str, Any]]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int]:
+    """Identify a file's current contents by (mtime_ns, size, inode)."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parse_yaml_file(path: Path) -> Mapping[str, Any]:
+    """Parse a YAML file, skipping the read and parse while it is unchanged on disk."""
+    stamp = _file_stamp(path)
+    key = path.resolve()
+    cached = _FILE_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = _FILE_CACHE[key] = (stamp, _freeze(_load_document(path, stamp)))
+    return cached[1]
+
+
+def _load_document(path: Path, stamp: tuple[int, int, int]) -> Mapping[str, Any]:
+    """
+    Parse a YAML config file, via a JSON sidecar when SNAIL_CONFIG_CACHE is set.
+
+    The sidecar (config.yaml -> config.yaml.cache.json) records the stamp of
+    the file it was made from and is only trusted while that still matches,
+    so later process starts skip YAML parsing for unchanged files. It is
+    opt-in because anyone able to write the sidecar can change the config.
+    """
+    if not _to_bool(os.environ.get("SNAIL_CONFIG_CACHE", "")):
+        return _parse_yaml_cached(path.read_text())
+
+    sidecar = path.with_name(path.name + ".cache.json")
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached["stamp"] == list(stamp):
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or corrupt sidecar; parse the YAML instead
+
+    document = _parse_yaml_cached(path.read_text())
+    _write_sidecar(sidecar, stamp, _thaw(document))
+    return document
+
+
+def _write_sidecar(sidecar: Path, stamp: tuple[int, int, int], document: dict[str, Any]) -> None:
+    """Atomically write a JSON sidecar, skipping documents JSON can't reproduce."""
+    try:
+        encoded = json.dumps({"stamp": stamp, "config": document})
+    except (TypeError, ValueError):
+        return  # e.g. YAML timestamps
+    if json.loads(encoded)["config"] != document:
+        return  # e.g. non-string keys, which JSON would turn into strings
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=f".{sidecar.name}.")
+    except OSError:
+        return  # Read-only config directory; go without a sidecar
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        os.replace(tmp_name, sidecar)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=32)
+def _load_fields(
+    cls: type[Config],
+    path: Path | None,
+    stamp: tuple[int, int, int] | None,
+    env: tuple[tuple[str, str], ...],
+) -> Mapping[str, Any]:
+    """
+    Resolve Config.load's field values, memoized on everything they depend on.
+
+    stamp isn't read here; as part of the cache key it (like env) makes an
+    edited file or a changed SNAIL_* variable resolve afresh.
+    """
+    config = cls._load_data(_parse_yaml_file(path) if path is not None else {}, env)
+    return _freeze({name: getattr(config, name) for name in cls.__dataclass_fields__})
+
+
+def _snail_env() -> tuple[tuple[str, str], ...]:
+    """Every SNAIL_* environment variable, sorted so it can key a cache."""
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("SNAIL_")))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Config:
     """
     Configuration container for Snail Core.
@@ -69,45 +406,19 @@ class Config:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-
-        return cls.from_dict(data)
+        return cls.from_dict(_parse_yaml_file(path))
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Config:
+    def from_dict(cls, data: Mapping[str, Any]) -> Config:
         """Create config from a dictionary."""
-        # Mapping from nested dict structure to flat attribute names
-        # This is the reverse of to_dict() structure
-        nested_to_flat = {
-            ("upload", "url"): "upload_url",
-            ("upload", "enabled"): "upload_enabled",
-            ("upload", "timeout"): "upload_timeout",
-            ("upload", "retries"): "upload_retries",
-            ("auth", "api_key"): "api_key",
-            ("auth", "cert_path"): "auth_cert_path",
-            ("auth", "key_path"): "auth_key_path",
-            ("collection", "enabled_collectors"): "enabled_collectors",
-            ("collection", "disabled_collectors"): "disabled_collectors",
-            ("collection", "timeout"): "collection_timeout",
-            ("output", "dir"): "output_dir",
-            ("output", "keep_local"): "keep_local_copy",
-            ("output", "compress"): "compress_output",
-            ("logging", "level"): "log_level",
-            ("logging", "file"): "log_file",
-            ("privacy", "anonymize_hostnames"): "anonymize_hostnames",
-            ("privacy", "redact_passwords"): "redact_passwords",
-            ("privacy", "exclude_paths"): "exclude_paths",
-        }
-
         # Flatten nested structure if present
         flat = {}
         for key, value in data.items():
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                 # Handle nested structure
                 for subkey, subvalue in value.items():
                     # Map nested key to flat attribute name
-                    flat_key = nested_to_flat.get((key, subkey), subkey)
+                    flat_key = _NESTED_TO_FLAT.get((key, subkey), subkey)
                     flat[flat_key] = subvalue
             else:
                 # Handle flat structure (already flat key)
@@ -115,7 +426,8 @@ class Config:
 
         # Filter to only known fields
         known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in flat.items() if k in known_fields}
+        # Cached documents are frozen; give the config its own mutable values
+        filtered = {k: _thaw(v) for k, v in flat.items() if k in known_fields}
 
         return cls(**filtered)
 
@@ -131,93 +443,80 @@ class Config:
         Returns:
             Fully resolved Config instance.
         """
-        base_config: dict[str, Any] = {}
-
-        # Find and load config file
+        # Find config file
+        found: Path | None = None
         if config_path:
             path = Path(config_path)
             if path.exists():
-                with open(path) as f:
-                    base_config = yaml.safe_load(f) or {}
+                found = path
         else:
             for path in DEFAULT_CONFIG_PATHS:
                 if path.exists():
-                    with open(path) as f:
-                        base_config = yaml.safe_load(f) or {}
+                    found = path
                     break
 
-        # Create config from file
-        config = cls.from_dict(base_config) if base_config else cls()
+        # Resolve against the cwd, since default paths may be relative
+        key_path = found.resolve() if found is not None else None
+        stamp = _file_stamp(found) if found is not None else None
+        env = _snail_env()
+
+        # Fresh instance (and lists) per call; the cached values stay untouched
+        return cls(**_thaw(_load_fields(cls, key_path, stamp, env)))
+
+    @classmethod
+    def load_text(cls, text: str) -> Config:
+        """
+        Load configuration from YAML text with environment overrides applied.
+
+        Args:
+            text: YAML config document. Empty text yields default values.
+
+        Returns:
+            Fully resolved Config instance.
+        """
+        return cls._load_data(_parse_yaml_cached(text) if text else {}, _snail_env())
+
+    # Same YAML-text constructor under its other name, so the two can't drift
+    from_string = load_text
 
-        # Override with environment variables
-        config._apply_env_overrides()
+    @classmethod
+    def _load_data(cls, data: Mapping[str, Any], env: tuple[tuple[str, str], ...]) -> Config:
+        """Build a config from parsed YAML data and apply environment overrides."""
+        # Create config from file contents
+        config = cls.from_dict(data) if data else cls()
+
+        # env already holds every SNAIL_* variable; with none set there is nothing to override
+        if env:
+            config._apply_env_overrides()
 
         return config
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget previously loaded configs, parsed config files and YAML documents."""
+        _load_fields.cache_clear()
+        _FILE_CACHE.clear()
+        _parse_yaml_cached.cache_clear()
+
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides."""
-        env_mappings = {
-            "SNAIL_UPLOAD_URL": "upload_url",
-            "SNAIL_UPLOAD_ENABLED": "upload_enabled",
-            "SNAIL_UPLOAD_TIMEOUT": "upload_timeout",
-            "SNAIL_API_KEY": "api_key",
-            "SNAIL_AUTH_CERT": "auth_cert_path",
-            "SNAIL_AUTH_KEY": "auth_key_path",
-            "SNAIL_OUTPUT_DIR": "output_dir",
-            "SNAIL_LOG_LEVEL": "log_level",
-            "SNAIL_LOG_FILE": "log_file",
-        }
-
-        for env_var, attr in env_mappings.items():
+        for env_var, attr, coerce in _ENV_MAP:
             value = os.environ.get(env_var)
             if value is not None:
                 try:
-                    # Type coercion with error handling
-                    current = getattr(self, attr)
-                    if isinstance(current, bool):
-                        setattr(self, attr, value.lower() in ("true", "1", "yes"))
-                    elif isinstance(current, int):
-                        setattr(self, attr, int(value))
-                    else:
-                        setattr(self, attr, value)
-                except (ValueError, AttributeError):
+                    setattr(self, attr, coerce(value))
+                except (ValueError, TypeError):
                     # Skip invalid values, keep existing value
                     pass
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
-        return {
-            "upload": {
-                "url": self.upload_url,
-                "enabled": self.upload_enabled,
-                "timeout": self.upload_timeout,
-                "retries": self.upload_retries,
-            },
-            "auth": {
-                "api_key": "***" if self.api_key else None,
-                "cert_path": self.auth_cert_path,
-                "key_path": self.auth_key_path,
-            },
-            "collection": {
-                "enabled_collectors": self.enabled_collectors,
-                "disabled_collectors": self.disabled_collectors,
-                "timeout": self.collection_timeout,
-            },
-            "output": {
-                "dir": self.output_dir,
-                "keep_local": self.keep_local_copy,
-                "compress": self.compress_output,
-            },
-            "logging": {
-                "level": self.log_level,
-                "file": self.log_file,
-            },
-            "privacy": {
-                "anonymize_hostnames": self.anonymize_hostnames,
-                "redact_passwords": self.redact_passwords,
-                "exclude_paths": self.exclude_paths,
-            },
+        result: dict[str, Any] = {
+            section: {key: getattr(self, attr) for key, attr in fields}
+            for section, fields in _NESTED_SECTIONS
         }
+        result["auth"]["api_key"] = "***" if self.api_key else None
+        return result
 
     def save(self, path: str | Path) -> None:
         """Save configuration to a YAML file."""
@@ -225,4 +524,6 @@ class Config:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                self.to_dict(), f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+            )
@@ -9,20 +9,32 @@ from __future__ import annotations
 import json
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+try:
+    # orjson serializes large reports several times faster than the stdlib
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from snail_core._compat import DATACLASS_SLOTS
 from snail_core.auth import ensure_api_key
 from snail_core.collectors import get_all_collectors
 from snail_core.config import Config
 from snail_core.host_id import get_host_id
 from snail_core.uploader import Uploader
 
+if TYPE_CHECKING:
+    from snail_core.collectors.base import BaseCollector
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CollectionResult:
     """Result of a single collector run."""
 
@@ -33,7 +45,7 @@ class CollectionResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CollectionReport:
     """Complete collection report from all collectors."""
 
@@ -46,7 +58,12 @@ class CollectionReport:
     errors: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert report to dictionary for serialization."""
+        """
+        Convert report to dictionary for serialization.
+
+        The result is a shallow view: "data" and "errors" are the report's own
+        results dict and errors list, not copies.
+        """
         return {
             "meta": {
                 "hostname": self.hostname,
@@ -63,6 +80,33 @@ class CollectionReport:
         """Serialize report to JSON string."""
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize report to compact UTF-8 encoded JSON, as sent on upload.
+
+        Decodes to the same data as to_json(), except that with orjson
+        installed NaN and infinite floats are encoded as null.
+        """
+        data = self.to_dict()
+        encoded = _orjson_dumps(data) if orjson is not None else None
+        if encoded is None:
+            encoded = json.dumps(data, default=str).encode("utf-8")
+        return encoded
+
+
+def _orjson_dumps(data: dict[str, Any]) -> bytes | None:
+    """Encode with orjson, or return None if it rejects the data."""
+    # orjson has its own encodings for datetimes and dataclasses; hand them to
+    # default=str instead so the output matches the stdlib fallback
+    option = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    try:
+        return orjson.dumps(data, default=str, option=option)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+        return None
+
 
 class SnailCore:
     """
@@ -125,27 +169,50 @@ class SnailCore:
         # Filter collectors if specific names provided
         collectors_to_run = self.collectors
         if collector_names:
+            wanted = set(collector_names)
             collectors_to_run = {
-                name: cls for name, cls in self.collectors.items() if name in collector_names
+                name: cls for name, cls in self.collectors.items() if name in wanted
             }
 
         logger.info(f"Running {len(collectors_to_run)} collectors")
 
-        for name, collector_cls in collectors_to_run.items():
-            start = time.perf_counter()
-            try:
-                collector = collector_cls()
-                data = collector.collect()
-                duration = (time.perf_counter() - start) * 1000
-
-                report.results[name] = data
-                logger.debug(f"Collector '{name}' completed in {duration:.2f}ms")
-
-            except Exception as e:
-                duration = (time.perf_counter() - start) * 1000
-                error_msg = f"Collector '{name}' failed: {e}"
-                report.errors.append(error_msg)
-                logger.error(error_msg)
+        # Collectors are mostly blocked on subprocesses and file reads, so each
+        # one gets its own worker thread and they all start at once. A hung
+        # collector is abandoned once collection_timeout elapses instead of
+        # blocking the run, but its worker is not a daemon thread: the
+        # interpreter still waits for it to return before the process exits.
+        timeout = self.config.collection_timeout
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(collectors_to_run)), thread_name_prefix="snail-collector"
+        )
+        futures: dict[str, Future[tuple[dict[str, Any], float]]] = {}
+        try:
+            for name, collector_cls in collectors_to_run.items():
+                futures[name] = executor.submit(_run_collector, collector_cls)
+            # Every collector started together, so they share one deadline.
+            # Results are gathered in registry order to keep reports stable.
+            deadline = time.monotonic() + timeout
+            for name, future in futures.items():
+                try:
+                    data, duration = future.result(timeout=max(0, deadline - time.monotonic()))
+
+                    report.results[name] = data
+                    logger.debug(f"Collector '{name}' completed in {duration:.2f}ms")
+
+                except FuturesTimeout:
+                    future.cancel()
+                    error_msg = f"Collector '{name}' failed: timed out after {timeout}s"
+                    report.errors.append(error_msg)
+                    logger.error(error_msg)
+
+                except Exception as e:
+                    error_msg = f"Collector '{name}' failed: {e}"
+                    report.errors.append(error_msg)
+                    logger.error(error_msg)
+        finally:
+            # Join the idle workers, but don't wait on collectors that were
+            # abandoned after timing out
+            executor.shutdown(wait=all(future.done() for future in futures.values()))
 
         return report
 
@@ -199,6 +266,16 @@ class SnailCore:
         return report, upload_response
 
 
+def _run_collector(collector_cls: type[BaseCollector]) -> tuple[dict[str, Any], float]:
+    """Instantiate a collector and run its collection, returning (data, duration_ms)."""
+    import time
+
+    start = time.perf_counter_ns()
+    # Always a new instance, so per-run caches like _readable_cache start empty
+    data = collector_cls().collect()
+    return data, (time.perf_counter_ns() - start) / 1_000_000
+
+
 def run_collection(
     config: Config | None = None,
     collector_names: list[str] | None = None,
@@ -7,13 +7,17 @@ Handles secure transmission of collected data to a remote endpoint.
 from __future__ import annotations
 
 import gzip
-import json
 import logging
+import random
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from snail_core._compat import DATACLASS_SLOTS
 
 if TYPE_CHECKING:
     from snail_core.config import Config
@@ -21,8 +25,37 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shortest and longest wait between upload attempts, in seconds
+_BASE_BACKOFF = 1.0
+_MAX_BACKOFF = 30.0
+
+# Client errors that another attempt can't fix
+_NON_RETRYABLE_STATUSES = frozenset({400, 401, 403, 404})
+
+# Responses whose Retry-After header tells us how long the server wants us to wait
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# zlib's usual speed/size trade-off; gzip's default of 9 is ~10x slower on
+# report JSON for only a slightly smaller body
+_GZIP_LEVEL = 6
+
+
+@lru_cache(maxsize=1)
+def _shared_adapter() -> HTTPAdapter:
+    """
+    Connection pool shared by every Uploader in the process.
+
+    Sessions stay per-Uploader because they carry the API key and client
+    certificate. Their keep-alive connections live in this adapter, though,
+    so a rebuilt Uploader reuses open TCP/TLS connections to the server.
+    Transport-level retries are off; _upload_with_retry owns retrying.
+    Sharing is safe across Uploaders with different verify/cert settings
+    because requests>=2.32 keys pooled TLS connections on them.
+    """
+    return HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UploadResult:
     """Result of an upload operation."""
 
@@ -43,12 +76,17 @@ class Uploader:
     - API key authentication
     - Mutual TLS (client certificates)
     - Compression
-    - Retries with exponential backoff
+    - Retries with jittered exponential backoff
     """
 
     def __init__(self, config: Config):
         self.config = config
         self.session = requests.Session()
+        adapter = _shared_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Source of back-off jitter; tests swap in a seeded Random
+        self._rng = random.Random()
 
         # Configure authentication - use X-API-Key header
         if config.api_key:
@@ -89,17 +127,8 @@ class Uploader:
         if not url:
             raise ValueError("No upload URL configured")
 
-        # Prepare the data
-        payload = report.to_dict()
-        json_data = json.dumps(payload, default=str)
-
-        # Compress if enabled
-        if self.config.compress_output:
-            data = gzip.compress(json_data.encode("utf-8"))
-            headers = {"Content-Encoding": "gzip"}
-        else:
-            data = json_data.encode("utf-8")
-            headers = {}
+        # Serialize once; every retry attempt resends the same bytes
+        data, headers = self._serialize(report)
 
         # Upload with retries
         result = self._upload_with_retry(url, data, headers)
@@ -109,17 +138,34 @@ class Uploader:
 
         return result.response_data or {}
 
+    def _serialize(self, report: CollectionReport) -> tuple[bytes, dict[str, str]]:
+        """
+        Encode a report as the request body.
+
+        Returns:
+            Tuple of (body bytes, extra headers describing the encoding).
+        """
+        json_data = report.to_json_bytes()
+
+        # Compress if enabled
+        if self.config.compress_output:
+            # mtime=0 keeps the body byte-for-byte reproducible for identical reports
+            return gzip.compress(json_data, _GZIP_LEVEL, mtime=0), {"Content-Encoding": "gzip"}
+        return json_data, {}
+
     def _upload_with_retry(
         self,
         url: str,
         data: bytes,
         extra_headers: dict[str, str],
     ) -> UploadResult:
-        """Upload with exponential backoff retry logic."""
+        """Upload with jittered exponential backoff retry logic."""
         last_error = None
+        backoff = _BASE_BACKOFF
 
         for attempt in range(1, self.config.upload_retries + 1):
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
+            retry_after = 0.0
 
             try:
                 response = self.session.post(
@@ -129,7 +175,7 @@ class Uploader:
                     timeout=self.config.upload_timeout,
                 )
 
-                duration = (time.perf_counter() - start_time) * 1000
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
 
                 if response.ok:
                     try:
@@ -150,18 +196,22 @@ class Uploader:
                         duration_ms=duration,
                     )
 
-                # Non-retryable status codes
-                if response.status_code in (400, 401, 403, 404):
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+
+                # Non-retryable status codes; other 4xx such as 408 and 429 are transient
+                if response.status_code in _NON_RETRYABLE_STATUSES:
                     return UploadResult(
                         success=False,
                         status_code=response.status_code,
-                        error=f"HTTP {response.status_code}: {response.text[:200]}",
+                        error=error,
                         attempts=attempt,
                         duration_ms=duration,
                     )
 
                 # Retryable error
-                last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                last_error = error
+                if response.status_code in _RETRY_AFTER_STATUSES:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                 logger.warning(f"Upload attempt {attempt} failed: {last_error}")
 
             except requests.exceptions.Timeout:
@@ -176,11 +226,13 @@ class Uploader:
                 last_error = f"Request error: {e}"
                 logger.warning(f"Upload attempt {attempt} error: {e}")
 
-            # Exponential backoff before retry
+            # Decorrelated jitter keeps many agents from retrying in lockstep
             if attempt < self.config.upload_retries:
-                backoff = min(2**attempt, 30)  # Max 30 seconds
-                logger.debug(f"Retrying in {backoff} seconds...")
-                time.sleep(backoff)
+                backoff = min(_MAX_BACKOFF, self._rng.uniform(_BASE_BACKOFF, backoff * 3))
+                # Wait at least as long as the server asked, within the usual cap
+                delay = min(_MAX_BACKOFF, max(backoff, retry_after))
+                logger.debug(f"Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
 
         return UploadResult(
             success=False,
@@ -210,6 +262,13 @@ class Uploader:
         except requests.exceptions.RequestException:
             return False
 
+    def close(self) -> None:
+        """Close the session, leaving the shared connection pool open."""
+        # Session.close() closes every mounted adapter, which would drop the
+        # pool out from under every other Uploader in the process
+        self.session.adapters.clear()
+        self.session.close()
+
     def _get_version(self) -> str:
         """Get snail-core version."""
         try:
@@ -220,6 +279,15 @@ class Uploader:
             return "unknown"
 
 
+def _parse_retry_after(value: str | None) -> float:
+    """Seconds to wait from a delay-seconds Retry-After header, or 0 if absent or unparsable."""
+    # isdecimal(), not isdigit(): digits like "²" pass isdigit() but float() rejects them
+    if value and value.strip().isdecimal():
+        return float(value.strip())
+    # HTTP-date values are rare for uploads; the computed back-off covers them
+    return 0.0
+
+
 class UploadError(Exception):
     """Raised when upload fails."""
 
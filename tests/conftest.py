@@ -4,6 +4,8 @@ Pytest configuration for Snail Core tests.
 Configures pytest with custom markers and test settings.
 """
 
+import pytest
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -14,3 +16,18 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "cli: marks tests as CLI tests")
     config.addinivalue_line("markers", "e2e: marks tests as end-to-end tests")
     config.addinivalue_line("markers", "performance: marks tests as performance tests")
+    config.addinivalue_line(
+        "markers", "filesystem: real-filesystem variants of fake-fs tests (run with -m filesystem)"
+    )
+    # Registered here too so --strict-markers passes when pytest-xdist isn't installed
+    config.addinivalue_line("markers", "xdist_group(name): run tests in the same xdist worker")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip real-filesystem variants unless they were selected with -m filesystem."""
+    if "filesystem" in (config.option.markexpr or ""):
+        return
+    skip = pytest.mark.skip(reason="real-filesystem variant; select with -m filesystem")
+    for item in items:
+        if item.get_closest_marker("filesystem"):
+            item.add_marker(skip)
@@ -0,0 +1,25 @@
+"""
+Pytest configuration for error handling tests.
+
+Modules in this directory don't share mutable state (patches are scoped to
+each test and temp files live under pytest's per-worker basetemp), so each
+module is placed in its own xdist group and can run on a separate worker:
+
+    pytest -n auto --dist loadgroup -m integration tests/error_handling/
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+_HERE = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group error handling tests by module for pytest-xdist scheduling."""
+    for item in items:
+        path = Path(str(item.fspath))
+        if path.parent == _HERE:
+            item.add_marker(pytest.mark.xdist_group(f"error_handling.{path.stem}"))
@@ -6,27 +6,45 @@ Tests that collectors handle timeouts correctly and errors are properly captured
 
 from __future__ import annotations
 
-import unittest
+import dataclasses
+import threading
+from subprocess import CalledProcessError, TimeoutExpired
 from unittest.mock import patch
 
 import pytest
 
+from snail_core import collectors as collectors_module
 from snail_core.collectors.base import BaseCollector
 from snail_core.config import Config
 from snail_core.core import SnailCore
 
+pytestmark = pytest.mark.integration
+
+# Expected CollectionReport attribute types
+REPORT_FIELD_TYPES = {
+    "hostname": str,
+    "host_id": str,
+    "collection_id": str,
+    "timestamp": str,
+    "snail_version": str,
+    "results": dict,
+    "errors": list,
+}
+
 
-@pytest.mark.integration
 class TimeoutCollector(BaseCollector):
     """Test collector that simulates timeout behavior."""
 
     name = "timeout_test"
     description = "Test collector for timeout scenarios"
 
+    # Set by tests on cleanup so abandoned worker threads can exit
+    release = threading.Event()
+
     def collect(self):
-        # Simulate a timeout by raising an exception
-        # In a real scenario, this would be due to command timeouts or other issues
-        raise Exception("Collector timed out after 30 seconds")
+        # Block well past the configured collection_timeout, like a hung command
+        self.release.wait(timeout=30)
+        return {"status": "finished too late"}
 
 
 class SuccessCollector(BaseCollector):
@@ -49,175 +67,177 @@ class FailingCollector(BaseCollector):
         raise Exception("Simulated collector failure")
 
 
-class TestCollectorTimeouts(unittest.TestCase):
-    """Test collector timeout handling."""
+# Shared instance for run_command tests; run_command keeps no per-instance state
+_TIMEOUT = TimeoutCollector()
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Default config shared by the module; tests derive per-test copies from it."""
+    return Config()
 
-    def setUp(self):
-        """Set up test environment."""
-        self.config = Config()
-        self.config.collection_timeout = 1  # 1 second timeout for testing
 
-    def test_collector_timeout_error_capture(self):
+@pytest.fixture
+def make_core(monkeypatch, base_config):
+    """Build a SnailCore whose collector registry is replaced by the given map."""
+    TimeoutCollector.release.clear()
+
+    def _factory(collectors):
+        # get_all_collectors() copies the module-level registry, so swap that directly
+        monkeypatch.setattr(collectors_module, "COLLECTORS", collectors)
+        # 1 second timeout for testing
+        return SnailCore(dataclasses.replace(base_config, collection_timeout=1))
+
+    yield _factory
+    TimeoutCollector.release.set()
+
+
+class TestCollectorTimeouts:
+    """Test collector timeout handling."""
+
+    def test_collector_timeout_error_capture(self, make_core):
         """Test that collector timeouts are captured in error list."""
-        # Mock the collectors before SnailCore initialization
-        with patch(
-            "snail_core.core.get_all_collectors", return_value={"timeout_test": TimeoutCollector}
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["timeout_test"])
-
-            # Should have error in the errors list
-            self.assertTrue(len(report.errors) > 0)
-            error_found = any(
-                "timeout" in error.lower() or "timed out" in error.lower()
-                for error in report.errors
-            )
-            self.assertTrue(error_found, f"Timeout error not found in: {report.errors}")
-
-            # Should not have successful data
-            self.assertNotIn("timeout_test", report.results)
-
-    def test_collector_timeout_continues_with_other_collectors(self):
-        """Test that collection continues with other collectors after timeout."""
-        with patch(
-            "snail_core.core.get_all_collectors",
-            return_value={"timeout_test": TimeoutCollector, "success_test": SuccessCollector},
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["timeout_test", "success_test"])
+        core = make_core({"timeout_test": TimeoutCollector})
+        report = core.collect(["timeout_test"])
 
-            # Should have one error for timeout
-            self.assertEqual(len(report.errors), 1)
+        # Should have error in the errors list
+        assert len(report.errors) > 0
+        error_found = any(
+            "timeout" in error.lower() or "timed out" in error.lower() for error in report.errors
+        )
+        assert error_found, f"Timeout error not found in: {report.errors}"
 
-            # Should have successful data for the non-timeout collector
-            self.assertIn("success_test", report.results)
-            self.assertEqual(report.results["success_test"]["status"], "success")
+        # Should not have successful data
+        assert "timeout_test" not in report.results
 
-            # Should not have data for timeout collector
-            self.assertNotIn("timeout_test", report.results)
+    def test_collector_timeout_continues_with_other_collectors(self, make_core):
+        """Test that collection continues with other collectors after timeout."""
+        core = make_core({"timeout_test": TimeoutCollector, "success_test": SuccessCollector})
+        report = core.collect(["timeout_test", "success_test"])
 
-    def test_collector_exception_error_capture(self):
-        """Test that collector exceptions are captured in error list."""
-        with patch(
-            "snail_core.core.get_all_collectors", return_value={"fail_test": FailingCollector}
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["fail_test"])
+        # Should have one error for timeout
+        assert len(report.errors) == 1
 
-            # Should have error in the errors list
-            self.assertEqual(len(report.errors), 1)
-            self.assertIn("Simulated collector failure", report.errors[0])
+        # Should have successful data for the non-timeout collector
+        assert "success_test" in report.results
+        assert report.results["success_test"]["status"] == "success"
 
-            # Should not have successful data
-            self.assertNotIn("fail_test", report.results)
+        # Should not have data for timeout collector
+        assert "timeout_test" not in report.results
 
-    def test_successful_collector_not_affected_by_timeout(self):
+    def test_collector_exception_error_capture(self, make_core):
+        """Test that collector exceptions are captured in error list."""
+        core = make_core({"fail_test": FailingCollector})
+        report = core.collect(["fail_test"])
+
+        # Should have error in the errors list
+        assert len(report.errors) == 1
+        assert "Simulated collector failure" in report.errors[0]
+
+        # Should not have successful data
+        assert "fail_test" not in report.results
+
+    def test_timed_out_collector_keeps_its_worker_thread(self, make_core):
+        """Test that collect() returns while a hung collector's worker keeps running."""
+        core = make_core({"timeout_test": TimeoutCollector})
+        report = core.collect(["timeout_test"])
+
+        assert len(report.errors) == 1
+        # The abandoned worker is not a daemon thread, so the interpreter would
+        # wait for it at exit; the fixture releases it on teardown
+        workers = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("snail-collector") and thread.is_alive()
+        ]
+        assert workers
+        assert not any(thread.daemon for thread in workers)
+
+    def test_successful_collector_not_affected_by_timeout(self, make_core):
         """Test that successful collectors work normally."""
-        with patch(
-            "snail_core.core.get_all_collectors", return_value={"success_test": SuccessCollector}
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["success_test"])
+        core = make_core({"success_test": SuccessCollector})
+        report = core.collect(["success_test"])
 
-            # Should have no errors
-            self.assertEqual(len(report.errors), 0)
+        # Should have no errors
+        assert len(report.errors) == 0
 
-            # Should have successful data
-            self.assertIn("success_test", report.results)
-            self.assertEqual(report.results["success_test"]["status"], "success")
+        # Should have successful data
+        assert "success_test" in report.results
+        assert report.results["success_test"]["status"] == "success"
 
     def test_run_command_timeout_handling(self):
         """Test that run_command handles timeouts correctly."""
-        collector = TimeoutCollector()
-
         # Mock subprocess.run to raise TimeoutExpired
         with patch("subprocess.run") as mock_run:
-            from subprocess import TimeoutExpired
-
             mock_run.side_effect = TimeoutExpired(["sleep", "10"], 30)
 
-            stdout, stderr, returncode = collector.run_command(["sleep", "10"], timeout=1)
+            stdout, stderr, returncode = _TIMEOUT.run_command(["sleep", "10"], timeout=1)
 
-            self.assertEqual(stdout, "")
-            self.assertEqual(stderr, "Command timed out")
-            self.assertEqual(returncode, -1)
+            assert stdout == ""
+            assert stderr == "Command timed out"
+            assert returncode == -1
 
     def test_run_command_file_not_found(self):
         """Test that run_command handles missing commands."""
-        collector = TimeoutCollector()
+        stdout, stderr, returncode = _TIMEOUT.run_command(["nonexistent_command"])
 
-        stdout, stderr, returncode = collector.run_command(["nonexistent_command"])
-
-        self.assertEqual(stdout, "")
-        self.assertIn("Command not found", stderr)
-        self.assertEqual(returncode, -1)
+        assert stdout == ""
+        assert "Command not found" in stderr
+        assert returncode == -1
 
     def test_run_command_called_process_error(self):
         """Test that run_command handles command failures."""
-        collector = TimeoutCollector()
-
         with patch("subprocess.run") as mock_run:
-            from subprocess import CalledProcessError
-
             mock_run.side_effect = CalledProcessError(1, ["failing_cmd"], "out", "err")
 
-            stdout, stderr, returncode = collector.run_command(["failing_cmd"])
+            stdout, stderr, returncode = _TIMEOUT.run_command(["failing_cmd"])
 
-            self.assertEqual(stdout, "out")
-            self.assertEqual(stderr, "err")
-            self.assertEqual(returncode, 1)
+            assert stdout == "out"
+            assert stderr == "err"
+            assert returncode == 1
 
-    def test_multiple_collector_errors_accumulate(self):
+    def test_multiple_collector_errors_accumulate(self, make_core):
         """Test that multiple collector errors are all captured."""
-        with patch(
-            "snail_core.core.get_all_collectors",
-            return_value={
+        core = make_core(
+            {
                 "fail1": FailingCollector,
                 "fail2": FailingCollector,
                 "success": SuccessCollector,
-            },
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["fail1", "fail2", "success"])
+            }
+        )
+        report = core.collect(["fail1", "fail2", "success"])
 
-            # Should have 2 errors
-            self.assertEqual(len(report.errors), 2)
+        # Should have 2 errors
+        assert len(report.errors) == 2
 
-            # Should have successful data
-            self.assertIn("success", report.results)
-            self.assertNotIn("fail1", report.results)
-            self.assertNotIn("fail2", report.results)
+        # Should have successful data
+        assert "success" in report.results
+        assert "fail1" not in report.results
+        assert "fail2" not in report.results
 
-    def test_timeout_error_message_format(self):
+    def test_timeout_error_message_format(self, make_core):
         """Test that timeout error messages are properly formatted."""
-        with patch(
-            "snail_core.core.get_all_collectors", return_value={"timeout_test": TimeoutCollector}
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["timeout_test"])
-
-            self.assertEqual(len(report.errors), 1)
-            error_msg = report.errors[0]
-            self.assertIn("timeout_test", error_msg)
-            self.assertIn("failed", error_msg.lower())
-
-    def test_collection_report_structure_with_errors(self):
+        core = make_core({"timeout_test": TimeoutCollector})
+        report = core.collect(["timeout_test"])
+
+        assert len(report.errors) == 1
+        error_msg = report.errors[0]
+        assert "timeout_test" in error_msg
+        assert "failed" in error_msg.lower()
+
+    def test_collection_report_structure_with_errors(self, make_core):
         """Test that collection report maintains proper structure with errors."""
-        with patch(
-            "snail_core.core.get_all_collectors", return_value={"mixed_test": SuccessCollector}
-        ):
-            core = SnailCore(self.config)
-            report = core.collect(["mixed_test"])
-
-            # Check report has all required fields
-            self.assertIsInstance(report.hostname, str)
-            self.assertIsInstance(report.host_id, str)
-            self.assertIsInstance(report.collection_id, str)
-            self.assertIsInstance(report.timestamp, str)
-            self.assertIsInstance(report.snail_version, str)
-            self.assertIsInstance(report.results, dict)
-            self.assertIsInstance(report.errors, list)
-
-            # Should have successful results
-            self.assertIn("mixed_test", report.results)
-            self.assertEqual(len(report.errors), 0)
+        core = make_core({"mixed_test": SuccessCollector})
+        report = core.collect(["mixed_test"])
+
+        # Check report has all required fields with the expected types
+        wrong_types = {
+            name: type(getattr(report, name, None)).__name__
+            for name, expected in REPORT_FIELD_TYPES.items()
+            if not isinstance(getattr(report, name, None), expected)
+        }
+        assert not wrong_types, f"Unexpected report field types: {wrong_types}"
+
+        # Should have successful results
+        assert "mixed_test" in report.results
+        assert len(report.errors) == 0
@@ -6,31 +6,49 @@ Tests that collectors handle file read errors gracefully.
 
 from __future__ import annotations
 
+import os
 import tempfile
-import unittest
+from itertools import islice
 from pathlib import Path
 
 import pytest
 
+try:
+    from pyfakefs import helpers
+except ImportError:  # the real-filesystem run below doesn't need it
+    helpers = None
+
 from snail_core.collectors.base import BaseCollector
 
+pytestmark = pytest.mark.integration
+
+# Fixture files shared by every test in the module: name -> contents
+FIXTURE_FILES: dict[str, str | bytes] = {
+    "malformed.conf": "INVALID LINE\nKEY1=value1\n=incomplete key\nKEY2=value2\n",
+    "quoted.conf": "KEY1=\"quoted value\"\nKEY2='single quoted'\nKEY3=unquoted\n",
+    "colon.conf": "KEY1: value1\nKEY2 :value2\nKEY3:value3\n",
+    "empty": "",
+    "text.txt": "line 1\nline 2\nline 3",
+    "binary": b"\x00\x01\x02\x03binary data\x04\x05",
+}
+
 
-@pytest.mark.integration
 class FileErrorCollector(BaseCollector):
     """Test collector that exercises file reading functionality."""
 
     name = "file_error_test"
     description = "Test collector for file read error handling"
 
+    def __init__(self, malformed_path: str):
+        super().__init__()
+        self.malformed_path = malformed_path
+
     def collect(self):
-        result = {}
+        result = self.collect_smoke()
 
         # Test 1: Read existing file
         result["existing_file"] = self.read_file("/etc/hostname", "default_hostname")
 
-        # Test 2: Read missing file
-        result["missing_file"] = self.read_file("/does/not/exist", "default_value")
-
         # Test 3: Read file with permission issues
         result["permission_file"] = self.read_file("/etc/shadow", "no_permission")
 
@@ -38,198 +56,188 @@ class FileErrorCollector(BaseCollector):
         lines = self.read_file_lines("/etc/hostname")
         result["existing_file_lines"] = lines
 
-        # Test 5: Read file lines from missing file
-        lines = self.read_file_lines("/does/not/exist")
-        result["missing_file_lines"] = lines
-
-        # Test 6: Parse key-value file that exists
-        try:
-            kv_data = self.parse_key_value_file("/etc/os-release")
-            result["kv_parse_success"] = bool(kv_data)
-            result["kv_sample"] = list(kv_data.keys())[:3] if kv_data else []
-        except Exception as e:
-            result["kv_parse_error"] = str(e)
-
-        # Test 7: Parse key-value file that doesn't exist
-        kv_data = self.parse_key_value_file("/does/not/exist.conf")
-        result["kv_parse_missing"] = kv_data
+        # Test 6: Parse key-value file that exists (returns {} on failure)
+        kv_data = self.parse_key_value_file("/etc/os-release")
+        result["kv_parse_success"] = bool(kv_data)
+        result["kv_sample"] = list(islice(kv_data, 3))
 
         # Test 8: Parse malformed key-value file
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".conf") as f:
-            f.write("INVALID LINE WITHOUT EQUALS\nKEY1=value1\n=incomplete\nKEY2=value2\n")
-            temp_file = f.name
-
-        try:
-            kv_data = self.parse_key_value_file(temp_file)
-            result["kv_parse_malformed"] = kv_data
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
+        result["kv_parse_malformed"] = self.parse_key_value_file(self.malformed_path)
 
         return result
 
-
-class TestFileErrors(unittest.TestCase):
+    def collect_smoke(self):
+        """Run only the missing-file probes, which never get as far as open()."""
+        return {
+            # Test 2: Read missing file
+            "missing_file": self.read_file("/does/not/exist", "default_value"),
+            # Test 5: Read file lines from missing file
+            "missing_file_lines": self.read_file_lines("/does/not/exist"),
+            # Test 7: Parse key-value file that doesn't exist
+            "kv_parse_missing": self.parse_key_value_file("/does/not/exist.conf"),
+        }
+
+
+@pytest.fixture(scope="class")
+def files(request):
+    """
+    Write every fixture file once and map its name to its path.
+
+    By default the files live in a pyfakefs in-memory filesystem, so the
+    class never touches the disk. Classes marked filesystem get a real
+    temporary directory instead, removed in one go at class teardown.
+    """
+    fake_fs = None
+    if request.node.get_closest_marker("filesystem"):
+        tmp_dir = tempfile.TemporaryDirectory(prefix="kv")
+        request.addfinalizer(tmp_dir.cleanup)
+        directory = Path(tmp_dir.name)
+    elif helpers is None:
+        pytest.skip("pyfakefs is not installed")
+    else:
+        fake_fs = request.getfixturevalue("fs_class")
+        # No permission bits, so unreadable once the fake user drops root below
+        fake_fs.create_file("/etc/shadow", st_mode=0o100000)
+        directory = Path(fake_fs.create_dir("/kv").path)
+
+    paths = {}
+    for name, content in FIXTURE_FILES.items():
+        path = directory / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        paths[name] = str(path)
+
+    if fake_fs is not None:
+        helpers.set_uid(1000)
+        request.addfinalizer(helpers.reset_ids)
+    return paths
+
+
+@pytest.fixture(scope="class")
+def collector(files):
+    """One collector shared by the whole class; it holds no per-test state."""
+    return FileErrorCollector(files["malformed.conf"])
+
+
+class TestFileErrors:
     """Test file read error handling."""
 
-    def test_missing_file_returns_default(self):
+    def test_missing_file_returns_default(self, collector):
         """Test that missing files return default values."""
-        collector = FileErrorCollector()
-
         result = collector.read_file("/definitely/does/not/exist", "my_default")
 
-        self.assertEqual(result, "my_default")
+        assert result == "my_default"
 
-    def test_permission_denied_returns_default(self):
+    def test_permission_denied_returns_default(self, collector):
         """Test that permission denied returns default values."""
-        collector = FileErrorCollector()
-
         result = collector.read_file("/etc/shadow", "access_denied")
 
-        self.assertEqual(result, "access_denied")
+        assert result == "access_denied"
 
-    def test_read_file_lines_missing_file(self):
+    def test_read_file_lines_missing_file(self, collector):
         """Test that read_file_lines handles missing files."""
-        collector = FileErrorCollector()
-
         lines = collector.read_file_lines("/definitely/does/not/exist")
 
-        self.assertEqual(lines, [])
+        assert lines == []
 
-    def test_parse_key_value_missing_file(self):
+    def test_parse_key_value_missing_file(self, collector):
         """Test that parse_key_value_file handles missing files."""
-        collector = FileErrorCollector()
-
         data = collector.parse_key_value_file("/definitely/does/not/exist")
 
-        self.assertEqual(data, {})
+        assert data == {}
 
-    def test_parse_key_value_malformed_content(self):
+    def test_parse_key_value_malformed_content(self, collector, files):
         """Test that parse_key_value_file handles malformed content."""
-        collector = FileErrorCollector()
+        data = collector.parse_key_value_file(files["malformed.conf"])
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".conf") as f:
-            f.write("INVALID LINE\nKEY1=value1\n=incomplete key\nKEY2=value2\n")
-            temp_file = f.name
+        # Should parse valid lines and ignore invalid ones
+        assert "KEY1" in data
+        assert "KEY2" in data
+        assert data["KEY1"] == "value1"
+        assert data["KEY2"] == "value2"
 
-        try:
-            data = collector.parse_key_value_file(temp_file)
-
-            # Should parse valid lines and ignore invalid ones
-            self.assertIn("KEY1", data)
-            self.assertIn("KEY2", data)
-            self.assertEqual(data["KEY1"], "value1")
-            self.assertEqual(data["KEY2"], "value2")
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
-
-    def test_parse_key_value_with_quotes(self):
+    def test_parse_key_value_with_quotes(self, collector, files):
         """Test that parse_key_value_file handles quoted values."""
-        collector = FileErrorCollector()
+        data = collector.parse_key_value_file(files["quoted.conf"])
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".conf") as f:
-            f.write("KEY1=\"quoted value\"\nKEY2='single quoted'\nKEY3=unquoted\n")
-            temp_file = f.name
-
-        try:
-            data = collector.parse_key_value_file(temp_file)
+        assert data["KEY1"] == "quoted value"
+        assert data["KEY2"] == "single quoted"
+        assert data["KEY3"] == "unquoted"
 
-            self.assertEqual(data["KEY1"], "quoted value")
-            self.assertEqual(data["KEY2"], "single quoted")
-            self.assertEqual(data["KEY3"], "unquoted")
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
-
-    def test_parse_key_value_custom_separator(self):
+    def test_parse_key_value_custom_separator(self, collector, files):
         """Test that parse_key_value_file works with custom separators."""
-        collector = FileErrorCollector()
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".conf") as f:
-            f.write("KEY1: value1\nKEY2 :value2\nKEY3:value3\n")
-            temp_file = f.name
+        data = collector.parse_key_value_file(files["colon.conf"], separator=":")
 
-        try:
-            data = collector.parse_key_value_file(temp_file, separator=":")
+        assert data["KEY1"] == "value1"
+        assert data["KEY2"] == "value2"
+        assert data["KEY3"] == "value3"
 
-            self.assertEqual(data["KEY1"], "value1")
-            self.assertEqual(data["KEY2"], "value2")
-            self.assertEqual(data["KEY3"], "value3")
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
-
-    def test_file_operations_dont_crash_collector(self):
+    def test_file_operations_dont_crash_collector(self, collector):
         """Test that file operation failures don't crash the collector."""
-        collector = FileErrorCollector()
-
         # This should not raise an exception
-        result = collector.collect()
+        result = collector.collect_smoke()
 
-        # Should return a result dict
-        self.assertIsInstance(result, dict)
-        self.assertIn("missing_file", result)
-        self.assertIn("missing_file_lines", result)
-        self.assertIn("kv_parse_missing", result)
+        # Missing files fall back to each helper's default
+        assert result == {
+            "missing_file": "default_value",
+            "missing_file_lines": [],
+            "kv_parse_missing": {},
+        }
 
-    def test_empty_file_handling(self):
-        """Test handling of empty files."""
-        collector = FileErrorCollector()
+    def test_full_collect_reports_every_probe(self, collector):
+        """Test that collect() runs every probe and returns one key for each."""
+        result = collector.collect()
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            # Create empty file
-            temp_file = f.name
+        assert set(result) == {
+            "missing_file",
+            "missing_file_lines",
+            "kv_parse_missing",
+            "existing_file",
+            "permission_file",
+            "existing_file_lines",
+            "kv_parse_success",
+            "kv_sample",
+            "kv_parse_malformed",
+        }
+        assert result["missing_file"] == "default_value"
+        assert result["kv_parse_malformed"]["KEY1"] == "value1"
+        assert result["kv_parse_malformed"]["KEY2"] == "value2"
+
+    def test_empty_file_handling(self, collector, files):
+        """Test handling of empty files."""
+        empty_file = files["empty"]
 
-        try:
-            content = collector.read_file(temp_file, "default")
-            self.assertEqual(content, "")  # Empty file returns empty string
+        content = collector.read_file(empty_file, "default")
+        assert content == ""  # Empty file returns empty string
 
-            lines = collector.read_file_lines(temp_file)
-            self.assertEqual(lines, [])  # Empty file returns empty list
+        lines = collector.read_file_lines(empty_file)
+        assert lines == []  # Empty file returns empty list
 
-            kv_data = collector.parse_key_value_file(temp_file)
-            self.assertEqual(kv_data, {})  # Empty file returns empty dict
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
+        kv_data = collector.parse_key_value_file(empty_file)
+        assert kv_data == {}  # Empty file returns empty dict
 
-    def test_file_read_preserves_content(self):
+    def test_file_read_preserves_content(self, collector, files):
         """Test that successful file reads preserve content."""
-        collector = FileErrorCollector()
+        content = collector.read_file(files["text.txt"])
+        assert content == FIXTURE_FILES["text.txt"]
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            test_content = "line 1\nline 2\nline 3"
-            f.write(test_content)
-            temp_file = f.name
+        lines = collector.read_file_lines(files["text.txt"])
+        assert lines == ["line 1", "line 2", "line 3"]
 
-        try:
-            content = collector.read_file(temp_file)
-            self.assertEqual(content, test_content)
-
-            lines = collector.read_file_lines(temp_file)
-            self.assertEqual(lines, ["line 1", "line 2", "line 3"])
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
-
-    def test_binary_file_handling(self):
+    def test_binary_file_handling(self, collector, files):
         """Test handling of binary files (should not crash)."""
-        collector = FileErrorCollector()
+        content = collector.read_file_bytes(files["binary"], b"default")
+        # Raw bytes come back untouched, readable parts included
+        assert content == FIXTURE_FILES["binary"]
+        assert b"binary" in content
 
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
-            f.write(b"\x00\x01\x02\x03binary data\x04\x05")
-            temp_file = f.name
-
-        try:
-            content = collector.read_file(temp_file, "default")
-            # Should return the binary data as string (may include replacement chars)
-            self.assertIsInstance(content, str)
-            self.assertIn("binary", content)  # Should contain readable parts
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
-
-    def test_file_path_edge_cases(self):
+    def test_file_path_edge_cases(self, collector):
         """Test file operations with edge case paths."""
-        collector = FileErrorCollector()
-
         # Empty path
         result = collector.read_file("", "default")
-        self.assertEqual(result, "default")
+        assert result == "default"
 
         # None path (should handle gracefully)
         try:
@@ -241,4 +249,15 @@ class TestFileErrors(unittest.TestCase):
         # Very long path
         long_path = "/nonexistent/" + "a" * 200
         result = collector.read_file(long_path, "default")
-        self.assertEqual(result, "default")
+        assert result == "default"
+
+
+@pytest.mark.filesystem
+class TestFileErrorsRealFS(TestFileErrors):
+    """Run the same checks against the real filesystem (select with -m filesystem)."""
+
+    @pytest.mark.skipif(
+        hasattr(os, "geteuid") and os.geteuid() == 0, reason="root can read /etc/shadow"
+    )
+    def test_permission_denied_returns_default(self, collector):
+        super().test_permission_denied_returns_default(collector)
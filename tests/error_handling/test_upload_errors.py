@@ -6,8 +6,9 @@ Tests that upload operations handle various failure scenarios gracefully.
 
 from __future__ import annotations
 
-import unittest
-from unittest.mock import MagicMock, patch
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -16,222 +17,174 @@ from snail_core.config import Config
 from snail_core.core import CollectionReport, SnailCore
 from snail_core.uploader import Uploader, UploadError
 
+pytestmark = pytest.mark.integration
 
-@pytest.mark.integration
-class TestUploadErrors(unittest.TestCase):
-    """Test upload error handling scenarios."""
+# Upload settings shared by every test; nothing here mutates it
+_BASE_CONFIG = Config(
+    upload_enabled=True,
+    upload_url="https://test.example.com/api/upload",
+    api_key="test-key-123",
+    upload_retries=3,
+    upload_timeout=5,
+    compress_output=False,
+)
 
-    def setUp(self):
-        """Set up test configuration."""
-        self.config = Config(
-            upload_enabled=True,
-            upload_url="https://test.example.com/api/upload",
-            api_key="test-key-123",
-            upload_retries=3,
-            upload_timeout=5,
-            compress_output=False,
-        )
-        self.uploader = Uploader(self.config)
-
-        # Create a mock report
-        self.report = CollectionReport(
-            hostname="test-host",
-            host_id="test-host-id",
-            collection_id="test-collection-id",
-            timestamp="2024-01-01T00:00:00Z",
-            snail_version="1.0.0",
-        )
 
-    def test_network_connection_error(self):
+def _mk_response(status: int, text: str = "", payload: dict | None = None) -> SimpleNamespace:
+    """Build a stand-in for requests.Response with only what Uploader reads."""
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        ok=200 <= status < 300,
+        headers={},
+        json=lambda: payload,
+    )
+
+
+def _assert_upload_error(exc: UploadError, attempts: int, reason: str) -> None:
+    """Check an UploadError's attempt count and failure reason with one regex."""
+    pattern = rf"Upload failed after {attempts} attempts: .*{re.escape(reason)}"
+    assert re.search(pattern, str(exc)), str(exc)
+
+
+class _FakeSession:
+    """Stand-in for requests.Session that replays queued responses or exceptions."""
+
+    def __init__(self):
+        self.responses: list = []
+        self.calls: list[dict] = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Skip the uploader's retry back-off sleeps; only the attempt count matters here."""
+    with patch("snail_core.uploader.time.sleep", return_value=None) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(scope="class")
+def uploader():
+    """One uploader (and requests.Session) shared by the class."""
+    return Uploader(_BASE_CONFIG)
+
+
+@pytest.fixture
+def session(uploader, monkeypatch):
+    """Swap the shared uploader's session for a fresh _FakeSession."""
+    fake = _FakeSession()
+    monkeypatch.setattr(uploader, "session", fake)
+    return fake
+
+
+@pytest.fixture
+def report():
+    """A minimal report to upload; per test because uploads can append errors."""
+    return CollectionReport(
+        hostname="test-host",
+        host_id="test-host-id",
+        collection_id="test-collection-id",
+        timestamp="2024-01-01T00:00:00Z",
+        snail_version="1.0.0",
+    )
+
+
+class TestUploadErrors:
+    """Test upload error handling scenarios."""
+
+    def test_network_connection_error(self, uploader, session, report):
         """Test handling of network connection errors."""
-        with patch.object(
-            self.uploader.session,
-            "post",
-            side_effect=requests.exceptions.ConnectionError("Connection refused"),
-        ):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after", error_msg)
-            self.assertIn("Connection error", error_msg)
-
-    def test_timeout_error(self):
+        session.responses = [requests.exceptions.ConnectionError("Connection refused")] * 3
+
+        with pytest.raises(UploadError) as exc_info:
+            uploader.upload(report)
+
+        _assert_upload_error(exc_info.value, 3, "Connection error")
+
+    def test_timeout_error(self, uploader, session, report):
         """Test handling of request timeout errors."""
-        with patch.object(
-            self.uploader.session,
-            "post",
-            side_effect=requests.exceptions.Timeout("Request timed out"),
-        ):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after", error_msg)
-            self.assertIn("Request timed out", error_msg)
-
-    def test_authentication_failure_401(self):
-        """Test handling of 401 Unauthorized errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 1 attempts", error_msg)
-            self.assertIn("HTTP 401", error_msg)
-
-    def test_authentication_failure_403(self):
-        """Test handling of 403 Forbidden errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_response.text = "Forbidden"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 1 attempts", error_msg)
-            self.assertIn("HTTP 403", error_msg)
-
-    def test_server_error_500(self):
-        """Test handling of 500 Internal Server Error (retryable)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 3 attempts", error_msg)  # Should retry 3 times
-            self.assertIn("HTTP 500", error_msg)
-
-    def test_server_error_502(self):
-        """Test handling of 502 Bad Gateway (retryable)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 502
-        mock_response.text = "Bad Gateway"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 3 attempts", error_msg)
-            self.assertIn("HTTP 502", error_msg)
-
-    def test_bad_request_400_no_retry(self):
-        """Test handling of 400 Bad Request (non-retryable)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 1 attempts", error_msg)  # No retry
-            self.assertIn("HTTP 400", error_msg)
-
-    def test_not_found_404_no_retry(self):
-        """Test handling of 404 Not Found (non-retryable)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_response.ok = False
-
-        with patch.object(self.uploader.session, "post", return_value=mock_response):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after 1 attempts", error_msg)  # No retry
-            self.assertIn("HTTP 404", error_msg)
-
-    def test_ssl_tls_error(self):
+        session.responses = [requests.exceptions.Timeout("Request timed out")] * 3
+
+        with pytest.raises(UploadError) as exc_info:
+            uploader.upload(report)
+
+        _assert_upload_error(exc_info.value, 3, "Request timed out")
+
+    @pytest.mark.parametrize(
+        "status,text,attempts",
+        [
+            (401, "Unauthorized", 1),
+            (403, "Forbidden", 1),
+            (500, "Internal Server Error", 3),  # Retryable
+            (502, "Bad Gateway", 3),  # Retryable
+            (429, "Too Many Requests", 3),  # Retryable despite being 4xx
+            (400, "Bad Request", 1),
+            (404, "Not Found", 1),
+        ],
+    )
+    def test_http_error_status(self, uploader, session, report, status, text, attempts):
+        """Test that HTTP errors fail after the expected number of attempts."""
+        session.responses = [_mk_response(status, text)] * 3
+
+        with pytest.raises(UploadError) as exc_info:
+            uploader.upload(report)
+
+        _assert_upload_error(exc_info.value, attempts, f"HTTP {status}")
+        assert len(session.calls) == attempts
+
+    def test_ssl_tls_error(self, uploader, session, report):
         """Test handling of SSL/TLS certificate errors."""
-        with patch.object(
-            self.uploader.session,
-            "post",
-            side_effect=requests.exceptions.SSLError("SSL: CERTIFICATE_VERIFY_FAILED"),
-        ):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after", error_msg)
-            self.assertIn("SSL", error_msg)
-
-    def test_invalid_url_error(self):
+        session.responses = [requests.exceptions.SSLError("SSL: CERTIFICATE_VERIFY_FAILED")] * 3
+
+        with pytest.raises(UploadError) as exc_info:
+            uploader.upload(report)
+
+        _assert_upload_error(exc_info.value, 3, "SSL")
+
+    def test_invalid_url_error(self, report):
         """Test handling of invalid URL errors."""
         uploader = Uploader(Config(upload_url="not-a-valid-url", api_key="test"))
 
-        with self.assertRaises(UploadError):
-            uploader.upload(self.report)
+        with pytest.raises(UploadError):
+            uploader.upload(report)
 
-    def test_missing_upload_url(self):
+    def test_missing_upload_url(self, report):
         """Test handling when no upload URL is configured."""
         uploader = Uploader(Config(api_key="test"))
 
-        with self.assertRaises(ValueError) as cm:
-            uploader.upload(self.report)
+        with pytest.raises(ValueError, match="No upload URL configured"):
+            uploader.upload(report)
 
-        self.assertIn("No upload URL configured", str(cm.exception))
-
-    def test_request_exception_handling(self):
+    def test_request_exception_handling(self, uploader, session, report):
         """Test handling of general request exceptions."""
-        with patch.object(
-            self.uploader.session,
-            "post",
-            side_effect=requests.exceptions.RequestException("Network is unreachable"),
-        ):
-            with self.assertRaises(UploadError) as cm:
-                self.uploader.upload(self.report)
-
-            error_msg = str(cm.exception)
-            self.assertIn("Upload failed after", error_msg)
-            self.assertIn("Request error", error_msg)
-
-    def test_successful_upload_after_retries(self):
-        """Test successful upload after some retries."""
-        call_count = 0
+        session.responses = [requests.exceptions.RequestException("Network is unreachable")] * 3
 
-        def mock_post(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
+        with pytest.raises(UploadError) as exc_info:
+            uploader.upload(report)
 
-            mock_response = MagicMock()
-            if call_count < 3:  # Fail first 2 attempts
-                mock_response.status_code = 500
-                mock_response.text = "Internal Server Error"
-                mock_response.ok = False
-            else:  # Succeed on 3rd attempt
-                mock_response.status_code = 200
-                mock_response.text = '{"status": "ok"}'
-                mock_response.ok = True
-                mock_response.json.return_value = {"status": "ok"}
+        _assert_upload_error(exc_info.value, 3, "Request error")
 
-            return mock_response
+    def test_successful_upload_after_retries(self, uploader, session, report):
+        """Test successful upload after some retries."""
+        # Fail first 2 attempts, succeed on the 3rd
+        session.responses = [
+            _mk_response(500, "Internal Server Error"),
+            _mk_response(500, "Internal Server Error"),
+            _mk_response(200, '{"status": "ok"}', {"status": "ok"}),
+        ]
 
-        with patch.object(self.uploader.session, "post", side_effect=mock_post):
-            result = self.uploader.upload(self.report)
+        result = uploader.upload(report)
 
-            self.assertEqual(result["status"], "ok")
-            self.assertEqual(call_count, 3)  # Should have made 3 attempts
+        assert result["status"] == "ok"
+        assert len(session.calls) == 3  # Should have made 3 attempts
 
-    def test_upload_with_compression(self):
+    def test_upload_with_compression(self, report):
         """Test upload with compression enabled."""
         config = Config(
             upload_enabled=True,
@@ -240,29 +193,23 @@ class TestUploadErrors(unittest.TestCase):
             compress_output=True,
         )
         uploader = Uploader(config)
+        uploader.session = session = _FakeSession()
+        session.responses.append(_mk_response(200, '{"status": "ok"}', {"status": "ok"}))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = '{"status": "ok"}'
-        mock_response.ok = True
-        mock_response.json.return_value = {"status": "ok"}
-
-        with patch.object(uploader.session, "post", return_value=mock_response) as mock_post:
-            result = uploader.upload(self.report)
+        result = uploader.upload(report)
 
-            # Check that compression headers were sent
-            call_args = mock_post.call_args
-            headers = call_args[1]["headers"]
-            self.assertEqual(headers.get("Content-Encoding"), "gzip")
+        # Check that compression headers were sent
+        (call,) = session.calls
+        assert call["headers"].get("Content-Encoding") == "gzip"
 
-            self.assertEqual(result["status"], "ok")
+        assert result["status"] == "ok"
 
-    def test_snailcore_upload_error_handling(self):
+    def test_snailcore_upload_error_handling(self, report):
         """Test that SnailCore handles upload errors gracefully."""
-        core = SnailCore(self.config)
+        core = SnailCore(_BASE_CONFIG)
 
         # Mock successful collection
-        with patch.object(core, "collect", return_value=self.report):
+        with patch.object(core, "collect", return_value=report):
             # Mock uploader to fail
             with patch.object(core, "uploader") as mock_uploader:
                 mock_uploader.upload.side_effect = UploadError(
@@ -272,9 +219,9 @@ class TestUploadErrors(unittest.TestCase):
                 report, upload_response = core.collect_and_upload()
 
                 # Report should contain the upload error
-                self.assertTrue(len(report.errors) > 0)
+                assert len(report.errors) > 0
                 error_found = any("Upload failed" in error for error in report.errors)
-                self.assertTrue(error_found)
+                assert error_found
 
                 # Upload response should be None
-                self.assertIsNone(upload_response)
+                assert upload_response is None
@@ -6,8 +6,10 @@ Tests that upload retry logic works correctly for different error scenarios.
 
 from __future__ import annotations
 
+import random
 import unittest
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -16,6 +18,22 @@ from snail_core.config import Config
 from snail_core.uploader import Uploader, UploadResult
 
 
+class _FakeResponse:
+    """Lightweight stand-in for requests.Response with only what Uploader reads."""
+
+    def __init__(self, status_code: int, text: str = "", json_data: Any = None, headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.ok = 200 <= status_code < 300
+        self.headers = headers or {}
+        self._json = json_data
+
+    def json(self) -> Any:
+        if isinstance(self._json, Exception):
+            raise self._json
+        return self._json
+
+
 @pytest.mark.integration
 class TestUploadRetries(unittest.TestCase):
     """Test upload retry logic and exponential backoff."""
@@ -31,6 +49,11 @@ class TestUploadRetries(unittest.TestCase):
         )
         self.uploader = Uploader(self.config)
 
+        # Don't really wait out the back-off; timing tests patch sleep themselves
+        sleep_patcher = patch("snail_core.uploader.time.sleep")
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
     def test_retry_on_500_errors(self):
         """Test that 500 errors trigger retries."""
         call_count = 0
@@ -39,10 +62,7 @@ class TestUploadRetries(unittest.TestCase):
             nonlocal call_count
             call_count += 1
 
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_response.ok = False
+            mock_response = _FakeResponse(500, "Internal Server Error")
 
             return mock_response
 
@@ -81,10 +101,7 @@ class TestUploadRetries(unittest.TestCase):
 
     def test_no_retry_on_400_errors(self):
         """Test that 400 errors do not trigger retries."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_response.ok = False
+        mock_response = _FakeResponse(400, "Bad Request")
 
         with patch.object(self.uploader.session, "post", return_value=mock_response):
             result = self.uploader._upload_with_retry("https://test.example.com", b"{}", {})
@@ -95,10 +112,7 @@ class TestUploadRetries(unittest.TestCase):
 
     def test_no_retry_on_401_errors(self):
         """Test that 401 errors do not trigger retries."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_response.ok = False
+        mock_response = _FakeResponse(401, "Unauthorized")
 
         with patch.object(self.uploader.session, "post", return_value=mock_response):
             result = self.uploader._upload_with_retry("https://test.example.com", b"{}", {})
@@ -109,10 +123,7 @@ class TestUploadRetries(unittest.TestCase):
 
     def test_no_retry_on_403_errors(self):
         """Test that 403 errors do not trigger retries."""
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_response.text = "Forbidden"
-        mock_response.ok = False
+        mock_response = _FakeResponse(403, "Forbidden")
 
         with patch.object(self.uploader.session, "post", return_value=mock_response):
             result = self.uploader._upload_with_retry("https://test.example.com", b"{}", {})
@@ -123,10 +134,7 @@ class TestUploadRetries(unittest.TestCase):
 
     def test_no_retry_on_404_errors(self):
         """Test that 404 errors do not trigger retries."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_response.ok = False
+        mock_response = _FakeResponse(404, "Not Found")
 
         with patch.object(self.uploader.session, "post", return_value=mock_response):
             result = self.uploader._upload_with_retry("https://test.example.com", b"{}", {})
@@ -143,10 +151,7 @@ class TestUploadRetries(unittest.TestCase):
             sleep_calls.append(seconds)
 
         def mock_post(*args, **kwargs):
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_response.ok = False
+            mock_response = _FakeResponse(500, "Internal Server Error")
             return mock_response
 
         with patch.object(self.uploader.session, "post", side_effect=mock_post):
@@ -156,11 +161,64 @@ class TestUploadRetries(unittest.TestCase):
                 # Should have slept 2 times (between attempts 1-2 and 2-3)
                 self.assertEqual(len(sleep_calls), 2)
 
-                # First backoff should be 2^1 = 2 seconds
-                self.assertEqual(sleep_calls[0], 2)
+                # Decorrelated jitter: each delay is drawn from [1, 3 * previous]
+                self.assertTrue(1 <= sleep_calls[0] <= 3)
+                self.assertTrue(1 <= sleep_calls[1] <= 3 * sleep_calls[0])
 
-                # Second backoff should be 2^2 = 4 seconds
-                self.assertEqual(sleep_calls[1], 4)
+    def test_backoff_jitter_is_reproducible_with_seed(self):
+        """Test that a seeded random source gives a predictable back-off schedule."""
+        config = Config(upload_url="https://test.example.com/api/upload", upload_retries=5)
+        uploader = Uploader(config)
+        uploader._rng = random.Random(1234)
+
+        expected_rng = random.Random(1234)
+        expected = []
+        previous = 1.0
+        for _ in range(4):
+            previous = min(30.0, expected_rng.uniform(1.0, previous * 3))
+            expected.append(previous)
+
+        mock_response = _FakeResponse(500, "Internal Server Error")
+        with patch.object(uploader.session, "post", return_value=mock_response):
+            with patch("time.sleep") as mock_sleep:
+                uploader._upload_with_retry("https://test.example.com", b"{}", {})
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], expected)
+
+    def test_retry_after_header_extends_backoff(self):
+        """Test that a 429/503 Retry-After hint is honoured, up to the back-off cap."""
+        responses = [
+            _FakeResponse(429, "Too Many Requests", headers={"Retry-After": "10"}),
+            _FakeResponse(503, "Service Unavailable", headers={"Retry-After": "3600"}),
+            _FakeResponse(500, "Internal Server Error", headers={"Retry-After": "20"}),
+            _FakeResponse(503, "Service Unavailable", headers={"Retry-After": "soon"}),
+            _FakeResponse(429, "Too Many Requests", headers={"Retry-After": "\u00b2"}),
+            _FakeResponse(200, "{}", json_data={}),
+        ]
+        config = Config(upload_url="https://test.example.com/api/upload", upload_retries=6)
+        uploader = Uploader(config)
+        uploader._rng = random.Random(1234)
+
+        expected_rng = random.Random(1234)
+        backoffs = []
+        previous = 1.0
+        for _ in range(5):
+            previous = min(30.0, expected_rng.uniform(1.0, previous * 3))
+            backoffs.append(previous)
+
+        with patch.object(uploader.session, "post", side_effect=responses):
+            with patch("time.sleep") as mock_sleep:
+                result = uploader._upload_with_retry("https://test.example.com", b"{}", {})
+
+        self.assertTrue(result.success)
+        expected = [
+            max(backoffs[0], 10),
+            30.0,  # The server's hour is capped at the maximum back-off
+            backoffs[2],  # Retry-After only counts on 429 and 503
+            backoffs[3],  # Unparsable hints are ignored
+            backoffs[4],  # ...including non-decimal digits such as "²"
+        ]
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], expected)
 
     def test_maximum_retry_attempts(self):
         """Test that maximum retry attempts are respected."""
@@ -173,10 +231,7 @@ class TestUploadRetries(unittest.TestCase):
             nonlocal call_count
             call_count += 1
 
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_response.ok = False
+            mock_response = _FakeResponse(500, "Internal Server Error")
             return mock_response
 
         with patch.object(uploader.session, "post", side_effect=mock_post):
@@ -198,10 +253,7 @@ class TestUploadRetries(unittest.TestCase):
             sleep_calls.append(seconds)
 
         def mock_post(*args, **kwargs):
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_response.ok = False
+            mock_response = _FakeResponse(500, "Internal Server Error")
             return mock_response
 
         with patch.object(uploader.session, "post", side_effect=mock_post):
@@ -226,11 +278,9 @@ class TestUploadRetries(unittest.TestCase):
             if call_count <= 2:  # First 2 attempts fail
                 raise requests.exceptions.ConnectionError("Connection refused")
             else:  # 3rd attempt succeeds
-                mock_response = MagicMock()
-                mock_response.status_code = 200
-                mock_response.text = '{"status": "success"}'
-                mock_response.ok = True
-                mock_response.json.return_value = {"status": "success"}
+                mock_response = _FakeResponse(
+                    200, '{"status": "success"}', json_data={"status": "success"}
+                )
                 return mock_response
 
         with patch.object(self.uploader.session, "post", side_effect=mock_post):
@@ -273,11 +323,9 @@ class TestUploadRetries(unittest.TestCase):
 
     def test_json_parsing_error_handling(self):
         """Test handling of invalid JSON responses."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "not json response"
-        mock_response.ok = True
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response = _FakeResponse(
+            200, "not json response", json_data=ValueError("Invalid JSON")
+        )
 
         with patch.object(self.uploader.session, "post", return_value=mock_response):
             # Create a test report for upload
@@ -8,14 +8,78 @@ from __future__ import annotations
 
 import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from snail_core.collectors.base import BaseCollector
 from snail_core.config import Config
 from snail_core.core import CollectionReport, SnailCore
 
+ALL_COLLECTOR_NAMES = (
+    "system",
+    "hardware",
+    "network",
+    "packages",
+    "services",
+    "filesystem",
+    "security",
+    "logs",
+)
+
+
+@lru_cache(maxsize=None)
+def _mock_collector(collector_cls, name):
+    """Mock collector class that returns test data; built once per (base, name)."""
+
+    class MockCollector(collector_cls):
+        def collect(self):
+            return {
+                "collector": name,
+                "status": "success",
+                "test_data": f"data_from_{name}",
+                "items": ["item1", "item2"],
+            }
+
+    return MockCollector
+
+
+@lru_cache(maxsize=None)
+def _failing_mock_collector(collector_cls, name):
+    """Mock collector class that raises an exception; built once per (base, name)."""
+
+    class FailingMockCollector(collector_cls):
+        def collect(self):
+            raise Exception("Test failure for collector integration testing")
+
+    return FailingMockCollector
+
+
+def _mock_collectors(names=ALL_COLLECTOR_NAMES, failing=()):
+    """Registry of mock collectors for names; those in failing raise on collect."""
+    return {
+        name: (_failing_mock_collector if name in failing else _mock_collector)(BaseCollector, name)
+        for name in names
+    }
+
+
+def _fix_host_identity(test: unittest.TestCase) -> None:
+    """Pin the host ID and hostname for the rest of the test."""
+    for patcher in (
+        patch("snail_core.core.get_host_id", return_value="test-host-id-123"),
+        patch("socket.gethostname", return_value="test-host"),
+    ):
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+
+def _collect(config: Config, collectors: dict, collector_names=None) -> CollectionReport:
+    """Run SnailCore.collect against the given collector registry."""
+    with patch("snail_core.core.get_all_collectors", return_value=collectors):
+        return SnailCore(config).collect(collector_names=collector_names)
+
 
 @pytest.mark.integration
 class TestCollectorIntegration(unittest.TestCase):
@@ -23,15 +87,11 @@ class TestCollectorIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test environment with temporary directory."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        # Clean up any files created during tests
-        for file_path in self.temp_dir.glob("*"):
-            if file_path.is_file():
-                file_path.unlink()
-        self.temp_dir.rmdir()
+        # Removed along with any subdirectories the collectors create
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+        _fix_host_identity(self)
 
     def create_test_config(self) -> Config:
         """Create a test configuration."""
@@ -46,10 +106,7 @@ class TestCollectorIntegration(unittest.TestCase):
         config = self.create_test_config()
         core = SnailCore(config)
 
-        # Mock host_id to avoid file system operations
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                report = core.collect(collector_names=["system", "hardware"])
+        report = core.collect(collector_names=["system", "hardware"])
 
         # Verify report structure
         self.assertIsInstance(report, CollectionReport)
@@ -77,28 +134,10 @@ class TestCollectorIntegration(unittest.TestCase):
         config = self.create_test_config()
 
         # Mock all collectors to return minimal data quickly
-        mock_collectors = {}
-        expected_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in expected_collectors:
-            from snail_core.collectors.base import BaseCollector
-
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
+        expected_collectors = ALL_COLLECTOR_NAMES
+        mock_collectors = _mock_collectors(expected_collectors)
 
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect()
+        report = _collect(config, mock_collectors)
 
         # Verify report structure
         self.assertIsInstance(report, CollectionReport)
@@ -117,33 +156,10 @@ class TestCollectorIntegration(unittest.TestCase):
         """Test that collector errors are captured properly."""
         config = self.create_test_config()
 
-        # Create collectors where one fails
-        from snail_core.collectors.base import BaseCollector
+        # Make system collector fail
+        mock_collectors = _mock_collectors(failing={"system"})
 
-        mock_collectors = {}
-        expected_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in expected_collectors:
-            if name == "system":
-                # Make system collector fail
-                mock_collectors[name] = self._create_failing_mock_collector(BaseCollector, name)
-            else:
-                mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
-
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect()
+        report = _collect(config, mock_collectors)
 
         # Verify report structure
         self.assertIsInstance(report, CollectionReport)
@@ -164,29 +180,9 @@ class TestCollectorIntegration(unittest.TestCase):
         """Test collection with specific collector names."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
-
-        mock_collectors = {}
-        expected_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in expected_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
+        mock_collectors = _mock_collectors()
 
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(collector_names=["system", "hardware"])
+        report = _collect(config, mock_collectors, ["system", "hardware"])
 
         # Should only have results for requested collectors
         self.assertIn("system", report.results)
@@ -201,31 +197,11 @@ class TestCollectorIntegration(unittest.TestCase):
         """Test collection with invalid collector names (should be ignored)."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
+        mock_collectors = _mock_collectors()
 
-        mock_collectors = {}
-        expected_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in expected_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
-
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(
-                        collector_names=["system", "nonexistent", "hardware", "also_invalid"]
-                    )
+        report = _collect(
+            config, mock_collectors, ["system", "nonexistent", "hardware", "also_invalid"]
+        )
 
         # Should only have results for valid collectors
         self.assertIn("system", report.results)
@@ -240,29 +216,10 @@ class TestCollectorIntegration(unittest.TestCase):
         """Test collection with empty collector names (should run all)."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
+        expected_collectors = ALL_COLLECTOR_NAMES
+        mock_collectors = _mock_collectors(expected_collectors)
 
-        mock_collectors = {}
-        expected_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in expected_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
-
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(collector_names=[])
+        report = _collect(config, mock_collectors, [])
 
         # Should have results for all collectors
         for collector_name in expected_collectors:
@@ -276,10 +233,7 @@ class TestCollectorIntegration(unittest.TestCase):
         config = self.create_test_config()
         core = SnailCore(config)
 
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                report = core.collect(collector_names=["system", "hardware"])
+        report = core.collect(collector_names=["system", "hardware"])
 
         # Test to_dict() method
         report_dict = report.to_dict()
@@ -317,71 +271,24 @@ class TestCollectorIntegration(unittest.TestCase):
         self.assertEqual(parsed["meta"]["hostname"], "test-host")
         self.assertEqual(parsed["meta"]["host_id"], "test-host-id-123")
 
-    def _create_mock_collector(self, collector_cls, name):
-        """Create a mock collector class that returns test data."""
-
-        class MockCollector(collector_cls):
-            def collect(self):
-                return {
-                    "collector": name,
-                    "status": "success",
-                    "test_data": f"data_from_{name}",
-                    "items": ["item1", "item2"],
-                }
-
-        return MockCollector
-
-    def _create_failing_mock_collector(self, collector_cls, name):
-        """Create a mock collector class that raises an exception."""
-
-        class FailingMockCollector(collector_cls):
-            def collect(self):
-                raise Exception("Test failure for collector integration testing")
-
-        return FailingMockCollector
-
 
 class TestCollectorFiltering(unittest.TestCase):
     """Integration tests for collector filtering functionality."""
 
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        for file_path in self.temp_dir.glob("*"):
-            if file_path.is_file():
-                file_path.unlink()
-        self.temp_dir.rmdir()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+        _fix_host_identity(self)
 
     def test_collector_names_filtering(self):
         """Test filtering collectors by specific names."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
+        mock_collectors = _mock_collectors()
 
-        mock_collectors = {}
-        all_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in all_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
-
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(collector_names=["system", "hardware", "network"])
+        report = _collect(config, mock_collectors, ["system", "hardware", "network"])
 
         # Should only have results for specified collectors
         self.assertIn("system", report.results)
@@ -400,29 +307,9 @@ class TestCollectorFiltering(unittest.TestCase):
         """Test filtering to a small subset of collectors."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
-
-        mock_collectors = {}
-        all_collectors = [
-            "system",
-            "hardware",
-            "network",
-            "packages",
-            "services",
-            "filesystem",
-            "security",
-            "logs",
-        ]
-        for name in all_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
+        mock_collectors = _mock_collectors()
 
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(collector_names=["system"])
+        report = _collect(config, mock_collectors, ["system"])
 
         # Should only have results for system collector
         self.assertIn("system", report.results)
@@ -447,22 +334,11 @@ class TestCollectorFiltering(unittest.TestCase):
         """Test filtering with mix of valid and invalid collector names."""
         config = self.create_test_config()
 
-        # Mock collectors
-        from snail_core.collectors.base import BaseCollector
+        mock_collectors = _mock_collectors(["system", "hardware", "network"])
 
-        mock_collectors = {}
-        valid_collectors = ["system", "hardware", "network"]
-        for name in valid_collectors:
-            mock_collectors[name] = self._create_mock_collector(BaseCollector, name)
-
-        # Mock host_id and hostname
-        with patch("snail_core.core.get_host_id", return_value="test-host-id-123"):
-            with patch("socket.gethostname", return_value="test-host"):
-                with patch("snail_core.core.get_all_collectors", return_value=mock_collectors):
-                    core = SnailCore(config)
-                    report = core.collect(
-                        collector_names=["system", "invalid1", "hardware", "invalid2", "network"]
-                    )
+        report = _collect(
+            config, mock_collectors, ["system", "invalid1", "hardware", "invalid2", "network"]
+        )
 
         # Should only have results for valid collectors
         self.assertIn("system", report.results)
@@ -479,16 +355,3 @@ class TestCollectorFiltering(unittest.TestCase):
             upload_enabled=False,
             collection_timeout=30,
         )
-
-    def _create_mock_collector(self, collector_cls, name):
-        """Create a mock collector class that returns test data."""
-
-        class MockCollector(collector_cls):
-            def collect(self):
-                return {
-                    "collector": name,
-                    "status": "success",
-                    "test_data": f"data_from_{name}",
-                }
-
-        return MockCollector
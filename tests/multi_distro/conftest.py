@@ -0,0 +1,44 @@
+"""
+Pytest configuration for multi-distribution tests.
+
+Collectors are imported inside fixtures so that collecting or deselecting
+these tests never imports snail_core.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# Result for any command without a canned reply, as if it were not installed
+NOT_FOUND = ("", "", 1)
+
+
+@pytest.fixture(scope="package")
+def packages_collector():
+    """One PackagesCollector shared by the APT and DNF tests; each test mocks what it runs."""
+    from snail_core.collectors.packages import PackagesCollector
+
+    return PackagesCollector()
+
+
+@pytest.fixture
+def command_replies():
+    """
+    Canned (stdout, stderr, returncode) keyed by the exact argv a collector runs.
+
+    Test modules override this with their own table; anything missing from it
+    replies as a command that is not installed.
+    """
+    return {}
+
+
+@pytest.fixture
+def mock_run(packages_collector, command_replies, monkeypatch):
+    """Answer run_command from command_replies; tests may set their own side_effect."""
+    mock = MagicMock(
+        side_effect=lambda cmd, *args, **kwargs: command_replies.get(tuple(cmd), NOT_FOUND)
+    )
+    monkeypatch.setattr(packages_collector, "run_command", mock)
+    return mock
@@ -6,184 +6,115 @@ Tests PackagesCollector on Debian, Ubuntu, and other APT-based systems.
 
 from __future__ import annotations
 
-import unittest
 from unittest.mock import patch
 
 import pytest
 
-from snail_core.collectors.packages import PackagesCollector
+pytestmark = [pytest.mark.integration, pytest.mark.usefixtures("mock_run")]
 
+# Canned (stdout, stderr, returncode) keyed by the exact argv PackagesCollector runs
+_APT_COMMANDS: dict[tuple[str, ...], tuple[str, str, int]] = {
+    ("apt", "list", "--upgradable"): (
+        "Listing...\nlinux-image-5.15.0-26-generic/focal 5.15.0-26.26 amd64 [upgradable from: 5.15.0-25.25]\n",
+        "",
+        0,
+    ),
+}
 
-@pytest.mark.integration
-class TestAptDistros(unittest.TestCase):
-    """Test PackagesCollector on APT-based distributions."""
-
-    def setUp(self):
-        """Set up test collector."""
-        self.collector = PackagesCollector()
 
-    def test_debian_detection_uses_apt(self):
-        """Test that Debian detection results in APT package manager."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "debian"}),
-            patch.object(self.collector, "run_command") as mock_run,
-        ):
-            mock_run.side_effect = self._mock_apt_commands()
+@pytest.fixture
+def command_replies():
+    """Replies for every test in the module; run_command is mocked throughout."""
+    return _APT_COMMANDS
 
-            result = self.collector.collect()
 
-            self.assertEqual(result["package_manager"], "apt")
-            self.assertIn("repositories", result)
-            self.assertIn("upgradeable", result)
+class TestAptDistros:
+    """Test PackagesCollector on APT-based distributions."""
 
-    def test_ubuntu_detection_uses_apt(self):
-        """Test that Ubuntu detection results in APT package manager."""
+    def test_debian_detection_uses_apt(self, packages_collector):
+        """Test that Debian detection results in APT package manager."""
+        with patch.object(packages_collector, "detect_distro", return_value={"id": "debian"}):
+            result = packages_collector.collect()
+
+            assert result["package_manager"] == "apt"
+            assert "repositories" in result
+            assert "upgradeable" in result
+
+    @pytest.mark.parametrize(
+        "distro", [{"id": "ubuntu"}, {"id": "linuxmint", "like": "ubuntu debian"}]
+    )
+    def test_apt_based_distros_route_to_apt(self, packages_collector, distro):
+        """Test that APT-based distributions are collected through the APT path."""
         with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "ubuntu"}),
-            patch.object(self.collector, "run_command") as mock_run,
+            patch.object(packages_collector, "detect_distro", return_value=distro),
+            patch.object(packages_collector, "_collect_apt_based", return_value={}) as mock_apt,
         ):
-            mock_run.side_effect = self._mock_apt_commands()
-
-            result = self.collector.collect()
+            packages_collector.collect()
 
-            self.assertEqual(result["package_manager"], "apt")
+        mock_apt.assert_called_once_with()
 
-    def test_apt_repository_listing(self):
+    def test_apt_repository_listing(self, packages_collector):
         """Test APT repository listing functionality."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "ubuntu"}),
-            patch.object(self.collector, "run_command") as mock_run,
-            patch.object(
-                self.collector,
-                "read_file_lines",
-                return_value=[
-                    "deb http://archive.ubuntu.com/ubuntu focal main restricted",
-                    "# deb http://archive.ubuntu.com/ubuntu focal universe",
-                    "deb-src http://archive.ubuntu.com/ubuntu focal main",
-                ],
-            ),
+        with patch.object(
+            packages_collector,
+            "read_file_lines",
+            return_value=[
+                "deb http://archive.ubuntu.com/ubuntu focal main restricted",
+                "# deb http://archive.ubuntu.com/ubuntu focal universe",
+                "deb-src http://archive.ubuntu.com/ubuntu focal main",
+            ],
         ):
-            mock_run.side_effect = self._mock_apt_commands()
+            repos = packages_collector._get_apt_repositories()
 
-            result = self.collector.collect()
+        assert isinstance(repos, list)
+        assert len(repos) > 0
 
-            repos = result["repositories"]
-            self.assertIsInstance(repos, list)
-            self.assertGreater(len(repos), 0)
+        # Check repository structure
+        repo = repos[0]
+        assert "url" in repo
+        assert "suite" in repo
+        assert "components" in repo
+        assert repo["url"] == "http://archive.ubuntu.com/ubuntu"
+        assert repo["suite"] == "focal"
 
-            # Check repository structure
-            repo = repos[0]
-            self.assertIn("url", repo)
-            self.assertIn("suite", repo)
-            self.assertIn("components", repo)
-            self.assertEqual(repo["url"], "http://archive.ubuntu.com/ubuntu")
-            self.assertEqual(repo["suite"], "focal")
-
-    def test_apt_package_listing(self):
+    def test_apt_package_listing(self, packages_collector):
         """Test APT package listing and summary."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "debian"}),
-            patch.object(self.collector, "run_command") as mock_run,
-        ):
-            mock_run.side_effect = self._mock_apt_commands()
-
-            result = self.collector.collect()
+        summary = packages_collector._get_apt_summary()
 
-            summary = result["summary"]
-            self.assertIn("total_count", summary)
-            self.assertGreaterEqual(summary["total_count"], 0)
+        assert "total_count" in summary
+        assert summary["total_count"] >= 0
 
-    def test_apt_upgradeable_packages(self):
+    def test_apt_upgradeable_packages(self, packages_collector):
         """Test APT upgradeable packages detection."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "ubuntu"}),
-            patch.object(self.collector, "run_command") as mock_run,
-        ):
-            mock_run.side_effect = self._mock_apt_commands()
-
-            result = self.collector.collect()
+        upgradeable = packages_collector._get_apt_upgradeable()
 
-            upgradeable = result["upgradeable"]
-            self.assertIsInstance(upgradeable, dict)
+        assert upgradeable == {
+            "count": 1,
+            "packages": [{"name": "linux-image-5.15.0-26-generic", "version": "5.15.0-26.26"}],
+        }
 
-    def test_apt_config_parsing(self):
+    def test_apt_config_parsing(self, packages_collector):
         """Test APT configuration parsing."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "debian"}),
-            patch.object(self.collector, "run_command") as mock_run,
-        ):
-            mock_run.side_effect = self._mock_apt_commands()
-
-            result = self.collector.collect()
+        config = packages_collector._get_apt_config()
 
-            config = result["config"]
-            self.assertIsInstance(config, dict)
+        assert isinstance(config, dict)
+        assert config["gpgcheck"] is True
 
-    def test_apt_transaction_history(self):
+    def test_apt_transaction_history(self, packages_collector):
         """Test APT transaction history parsing."""
-        with (
-            patch.object(self.collector, "detect_distro", return_value={"id": "ubuntu"}),
-            patch.object(self.collector, "run_command") as mock_run,
+        with patch.object(
+            packages_collector,
+            "read_file_lines",
+            return_value=[
+                "Start-Date: 2024-01-01  10:00:00",
+                "Commandline: apt install vim",
+                "Install: vim:amd64 (2:8.1.2269-1ubuntu5)",
+                "End-Date: 2024-01-01  10:00:15",
+            ],
         ):
-            mock_run.side_effect = self._mock_apt_commands()
-
-            result = self.collector.collect()
-
-            transactions = result["recent_transactions"]
-            self.assertIsInstance(transactions, list)
-
-    def _mock_apt_commands(self):
-        """Mock APT command outputs for testing."""
-        call_count = 0
-
-        def mock_command(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            cmd = args[0] if args else []
-
-            if not cmd:
-                return ("", "", 1)
-
-            if cmd[0] == "apt":
-                if "list" in cmd and "--installed" in cmd:
-                    return (
-                        "Listing...\nlinux-image-5.15.0-25-generic/focal,focal,now 5.15.0-25.25 amd64 [installed]\nbash/focal,focal,now 5.0.17-1ubuntu1 amd64 [installed]\n",
-                        "",
-                        0,
-                    )
-                elif "list" in cmd and "--upgradable" in cmd:
-                    return (
-                        "Listing...\nlinux-image-5.15.0-26-generic/focal 5.15.0-26.26 amd64 [upgradable from: 5.15.0-25.25]\n",
-                        "",
-                        0,
-                    )
-                elif "show" in cmd:
-                    return ("Package: bash\nVersion: 5.0.17-1ubuntu1\n", "", 0)
-            elif cmd[0] == "dpkg":
-                if "--list" in cmd:
-                    return (
-                        "ii  linux-image-5.15.0-25-generic  5.15.0-25.25  amd64  Signed kernel image generic\nii  bash                           5.0.17-1ubuntu1 amd64  GNU Bourne Again SHell\n",
-                        "",
-                        0,
-                    )
-                elif "--get-selections" in cmd:
-                    return ("bash\t\t\tinstall\nlinux-image-generic\t\tinstall\n", "", 0)
-            elif cmd[0] == "grep" and "sources.list" in " ".join(cmd):
-                return (
-                    "deb http://archive.ubuntu.com/ubuntu focal main restricted\n# deb http://archive.ubuntu.com/ubuntu focal universe\n",
-                    "",
-                    0,
-                )
-            elif cmd[0] == "apt-config":
-                if "dump" in cmd:
-                    return ('APT::Architecture "amd64";\nAPT::Install-Recommends "1";\n', "", 0)
-            elif cmd[0] == "cat" and "/var/log/apt/history.log" in " ".join(cmd):
-                return (
-                    "Start-Date: 2024-01-01 10:00:00\nCommandline: apt install vim\nInstall: vim:amd64 (2:8.1.2269-1ubuntu5)\nEnd-Date: 2024-01-01 10:00:15\n",
-                    "",
-                    0,
-                )
-
-            return ("", "", 1)  # Command not found
-
-        return mock_command
+            transactions = packages_collector._get_apt_transactions()
+
+        assert transactions == [
+            {"info": "Start-Date: 2024-01-01  10:00:00"},
+            {"info": "Commandline: apt install vim"},
+        ]
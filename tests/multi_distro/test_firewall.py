@@ -11,8 +11,6 @@ from unittest.mock import patch
 
 import pytest
 
-from snail_core.collectors.security import SecurityCollector
-
 
 @pytest.mark.integration
 class TestFirewall(unittest.TestCase):
@@ -20,6 +18,8 @@ class TestFirewall(unittest.TestCase):
 
     def setUp(self):
         """Set up test collector."""
+        from snail_core.collectors.security import SecurityCollector
+
         self.collector = SecurityCollector()
 
     def test_firewalld_detection_running(self):
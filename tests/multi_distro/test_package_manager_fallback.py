@@ -11,8 +11,6 @@ from unittest.mock import patch
 
 import pytest
 
-from snail_core.collectors.packages import PackagesCollector
-
 
 @pytest.mark.integration
 class TestPackageManagerFallback(unittest.TestCase):
@@ -20,6 +18,8 @@ class TestPackageManagerFallback(unittest.TestCase):
 
     def setUp(self):
         """Set up test collector."""
+        from snail_core.collectors.packages import PackagesCollector
+
         self.collector = PackagesCollector()
 
     def test_unknown_distribution_fallback(self):
@@ -11,8 +11,6 @@ from unittest.mock import patch
 
 import pytest
 
-from snail_core.collectors.security import SecurityCollector
-
 
 @pytest.mark.integration
 class TestSelinux(unittest.TestCase):
@@ -20,6 +18,8 @@ class TestSelinux(unittest.TestCase):
 
     def setUp(self):
         """Set up test collector."""
+        from snail_core.collectors.security import SecurityCollector
+
         self.collector = SecurityCollector()
 
     def test_selinux_enabled_and_enforcing(self):
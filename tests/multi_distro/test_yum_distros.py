@@ -11,8 +11,6 @@ from unittest.mock import patch
 
 import pytest
 
-from snail_core.collectors.packages import PackagesCollector
-
 
 @pytest.mark.integration
 class TestYumDistros(unittest.TestCase):
@@ -20,6 +18,8 @@ class TestYumDistros(unittest.TestCase):
 
     def setUp(self):
         """Set up test collector."""
+        from snail_core.collectors.packages import PackagesCollector
+
         self.collector = PackagesCollector()
 
     def test_rhel_7_detection_uses_yum(self):
@@ -7,8 +7,10 @@ and distribution detection.
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -111,6 +113,36 @@ class TestBaseCollectorReadFile:
         content = collector.read_file("/nonexistent/file/path", default="default value")
         assert content == "default value"
 
+    def test_read_file_missing_skips_open(self):
+        """Test that unreadable paths return the default without calling open()."""
+        collector = ConcreteCollector()
+        with patch("builtins.open") as mock_open:
+            assert collector.read_file("/nonexistent/file/path", "default") == "default"
+            assert collector.read_file("", "default") == "default"
+        mock_open.assert_not_called()
+
+    def test_read_file_caches_missing_path_lookups(self):
+        """Test that repeated probes of a missing path only check it once."""
+        collector = ConcreteCollector()
+        with patch("snail_core.collectors.base.os.access", return_value=False) as mock_access:
+            for _ in range(3):
+                assert collector.read_file("/nonexistent/file/path", "default") == "default"
+            assert collector.parse_key_value_file("/nonexistent/file/path") == {}
+        mock_access.assert_called_once_with("/nonexistent/file/path", os.R_OK)
+
+    def test_read_file_bytes(self):
+        """Test reading raw bytes, and the default for a missing file."""
+        collector = ConcreteCollector()
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+            f.write(b"\xff\x00data\r\n")
+            temp_path = f.name
+
+        try:
+            assert collector.read_file_bytes(temp_path) == b"\xff\x00data\r\n"
+            assert collector.read_file_bytes("/nonexistent/file/path", b"none") == b"none"
+        finally:
+            Path(temp_path).unlink()
+
     def test_read_file_lines(self):
         """Test read_file_lines() returns list of lines."""
         collector = ConcreteCollector()
@@ -199,6 +231,19 @@ class TestBaseCollectorParseKeyValueFile:
         finally:
             Path(temp_path).unlink()
 
+    def test_parse_key_value_file_splits_on_first_separator(self):
+        """Test values keep later separators and mismatched quotes."""
+        collector = ConcreteCollector()
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("  OPTS = a=b  \n  #x=y\nnosep\nkey2=\"unbalanced'\n")
+            temp_path = f.name
+
+        try:
+            result = collector.parse_key_value_file(temp_path)
+            assert result == {"OPTS": "a=b", "key2": "\"unbalanced'"}
+        finally:
+            Path(temp_path).unlink()
+
 
 class TestBaseCollectorDetectDistro:
     """Test detect_distro() method."""
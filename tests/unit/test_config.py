@@ -8,6 +8,7 @@ and configuration precedence.
 from __future__ import annotations
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -30,6 +31,14 @@ class TestConfigDefaults:
         assert config.log_level == "INFO"
         assert config.output_dir == "/var/lib/snail-core"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_config_uses_slots(self):
+        """Test that Config instances are slotted and reject unknown attributes."""
+        config = Config()
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_field = "value"
+
 
 class TestConfigFromDict:
     """Test Config creation from dictionary."""
@@ -103,6 +112,171 @@ class TestConfigFromFile:
         finally:
             os.unlink(temp_path)
 
+    def test_from_file_reuses_parse_while_unchanged(self):
+        """Test that an unchanged file isn't re-read, and an edited one is."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "config.yaml"
+            path.write_text("upload:\n  url: https://example.com/api\n")
+
+            first = Config.from_file(path)
+            with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+                assert Config.load(path).upload_url == first.upload_url
+
+            path.write_text("upload:\n  url: https://changed.example.com/api\n")
+            assert Config.from_file(path).upload_url == "https://changed.example.com/api"
+
+            Config.clear_cache()
+            assert Config.from_file(path).upload_url == "https://changed.example.com/api"
+
+    def test_from_file_json_sidecar(self):
+        """Test that SNAIL_CONFIG_CACHE writes a JSON sidecar and reuses it across runs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "config.yaml"
+            sidecar = Path(temp_dir) / "config.yaml.cache.json"
+            path.write_text("upload:\n  url: https://example.com/api\n")
+
+            with patch.dict(os.environ, {"SNAIL_CONFIG_CACHE": "1"}):
+                Config.clear_cache()
+                assert Config.from_file(path).upload_url == "https://example.com/api"
+                assert sidecar.exists()
+
+                # A fresh process (empty in-memory caches) skips YAML parsing
+                Config.clear_cache()
+                with patch("snail_core.config.yaml.load") as mock_load:
+                    assert Config.from_file(path).upload_url == "https://example.com/api"
+                mock_load.assert_not_called()
+
+                # Editing the YAML makes the sidecar stale
+                path.write_text("upload:\n  url: https://changed.example.com/api\n")
+                assert Config.from_file(path).upload_url == "https://changed.example.com/api"
+
+            # Without the opt-in, no sidecar is written
+            Config.clear_cache()
+            sidecar.unlink()
+            Config.from_file(path)
+            assert not sidecar.exists()
+
+
+class TestConfigLoad:
+    """Test Config.load() resolution and memoization."""
+
+    def test_load_memoized_until_inputs_change(self):
+        """Test that repeat loads reuse the resolution but react to env and file edits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "config.yaml"
+            path.write_text("upload:\n  url: https://example.com/api\nexclude_paths: [/tmp]\n")
+
+            first = Config.load(path)
+            with patch("snail_core.config._parse_yaml_file", side_effect=AssertionError("re-read")):
+                second = Config.load(path)
+            assert second == first and second is not first
+
+            # Instances don't share mutable values through the cache
+            second.exclude_paths.append("/var")
+            assert Config.load(path).exclude_paths == ["/tmp"]
+
+            with patch.dict(os.environ, {"SNAIL_LOG_LEVEL": "DEBUG"}):
+                assert Config.load(path).log_level == "DEBUG"
+
+            path.write_text("upload:\n  url: https://changed.example.com/api\n")
+            assert Config.load(path).upload_url == "https://changed.example.com/api"
+
+    def test_load_skips_env_overrides_without_snail_vars(self):
+        """Test that the env overlay is skipped when no SNAIL_* variable is set."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "config.yaml"
+            path.write_text("log_level: WARNING\n")
+            with patch.dict(os.environ, {"HOME": "/root"}, clear=True):
+                with patch.object(Config, "_apply_env_overrides") as mock_apply:
+                    assert Config.load(path).log_level == "WARNING"
+            mock_apply.assert_not_called()
+
+
+class TestConfigFromString:
+    """Test Config creation from YAML text."""
+
+    def test_from_string_nested_yaml(self):
+        """Test loading Config from YAML text."""
+        config = Config.from_string("upload:\n  url: https://example.com/api\n")
+        assert config.upload_url == "https://example.com/api"
+
+    def test_from_string_empty(self):
+        """Test that empty text yields defaults."""
+        config = Config.from_string("")
+        assert config.upload_url is None
+
+    def test_from_string_applies_env_like_load_text(self):
+        """Test that from_string() and load_text() resolve text the same way."""
+        text = "upload:\n  url: https://example.com/api\n"
+        with patch.dict(os.environ, {"SNAIL_UPLOAD_URL": "https://env.example.com"}):
+            assert Config.from_string(text) == Config.load_text(text)
+            assert Config.from_string(text).upload_url == "https://env.example.com"
+
+    def test_from_string_unclosed_flow_fails_fast(self):
+        """Test that an unclosed [ or { is rejected before the YAML parser runs."""
+        with patch("snail_core.config.yaml.load") as mock_load:
+            with pytest.raises(yaml.YAMLError, match="line 2"):
+                Config.from_string("upload:\n  [unclosed bracket\n")
+        mock_load.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            'api_key: "abc]["\n',
+            "api_key: 'it''s [x'\n",
+            "# [not closed\nlog_level: DEBUG\n",
+            "log_level: DEBUG  # {note\n",
+            "log_file: |\n  [literal\n",
+            "exclude_paths: [/tmp,\n  /var]\n",
+        ],
+    )
+    def test_from_string_brackets_in_valid_yaml(self, text):
+        """Test that brackets in strings, comments and block scalars aren't flagged."""
+        assert isinstance(Config.from_string(text), Config)
+
+    def test_from_string_flat_yaml_skips_parser(self):
+        """Test that flat key: value text is typed like PyYAML without running it."""
+        text = (
+            "# flat config\n"
+            "upload_url: https://example.com/api?x=1#top\n"
+            "upload_enabled: off\n"
+            "upload_timeout: 60\n"
+            "api_key: 'quoted: key'\n"
+            "log_file:\n"
+        )
+        expected = yaml.safe_load(text)
+        with patch("snail_core.config.yaml.load") as mock_load:
+            config = Config.from_string(text)
+        mock_load.assert_not_called()
+        assert config.upload_url == expected["upload_url"]
+        assert config.upload_enabled is False
+        assert config.upload_timeout == 60
+        assert config.api_key == "quoted: key"
+        assert config.log_file is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "upload_timeout: 1.5\n",
+            "upload_timeout: 0x1f\n",
+            "log_level: DEBUG  # comment\n",
+            "exclude_paths: [/tmp]\n",
+            "upload:\n  url: https://example.com/api\n",
+        ],
+    )
+    def test_from_string_non_flat_yaml_uses_parser(self, text):
+        """Test that anything beyond plain flat scalars is left to PyYAML."""
+        assert Config.from_string(text) == Config.from_dict(yaml.safe_load(text))
+
+    def test_from_string_cached_parse_not_shared(self):
+        """Test that configs parsed from identical text don't share mutable values."""
+        text = "collection:\n  enabled_collectors: [system]\n"
+        first = Config.from_string(text)
+        first.enabled_collectors.append("network")
+
+        second = Config.from_string(text)
+        assert second.enabled_collectors == ["system"]
+
 
 class TestConfigEnvironmentOverrides:
     """Test environment variable overrides."""
@@ -212,6 +386,20 @@ class TestConfigSerialization:
         assert result["upload"]["enabled"] is True
         assert result["logging"]["level"] == "DEBUG"
 
+    def test_to_dict_round_trips_through_from_dict(self):
+        """Test that every field survives to_dict() -> from_dict() apart from the API key."""
+        config = Config(
+            upload_url="https://example.com/api",
+            upload_retries=5,
+            auth_cert_path="/cert.pem",
+            enabled_collectors=["system"],
+            collection_timeout=60,
+            keep_local_copy=True,
+            log_file="/var/log/snail.log",
+            exclude_paths=["/tmp"],
+        )
+        assert Config.from_dict(config.to_dict()) == config
+
     def test_to_dict_password_redaction(self):
         """Test that to_dict() redacts API key."""
         config = Config(api_key="secret-key-123")
@@ -225,6 +413,10 @@ class TestConfigSerialization:
         result2 = config2.to_dict()
         assert result2["auth"]["api_key"] is None
 
+    def test_to_dict_empty_api_key_is_none(self):
+        """Test that an empty API key serializes as unset rather than as ''."""
+        assert Config(api_key="").to_dict()["auth"]["api_key"] is None
+
     def test_save_and_load_round_trip(self):
         """Test round-trip: save() -> load() -> compare."""
         original_config = Config(
@@ -6,9 +6,18 @@ Tests core orchestration, collector execution, and report generation.
 
 from __future__ import annotations
 
+import json
+import math
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import pytest
+
+from snail_core import core as core_module
 from snail_core.config import Config
 from snail_core.core import CollectionReport, SnailCore
 
@@ -142,6 +151,54 @@ class TestSnailCoreCollect:
         mock_instance1.collect.assert_called_once()
         mock_instance2.collect.assert_called_once()
 
+    def test_collect_runs_collectors_concurrently(self):
+        """Test that collectors run at the same time and results keep registry order."""
+        core = SnailCore()
+        # Each collector blocks until both are running, so a sequential run would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_class(name):
+            mock_class = MagicMock()
+            mock_class.return_value.collect.side_effect = lambda: {name: barrier.wait()}
+            return mock_class
+
+        collectors = {"first": make_class("first"), "second": make_class("second")}
+
+        with patch.object(core, "collectors", collectors):
+            report = core.collect()
+
+        assert report.errors == []
+        assert list(report.results) == ["first", "second"]
+
+    def test_collect_starts_every_collector_at_once(self):
+        """Test that a large collector set runs together, so none waits out the deadline queued."""
+        core = SnailCore()
+        collectors = {}
+        # More collectors than a small fixed pool would run at once
+        barrier = threading.Barrier(12, timeout=5)
+        for i in range(12):
+            mock_class = MagicMock()
+            mock_class.return_value.collect.side_effect = lambda: {"waited": barrier.wait()}
+            collectors[f"collector{i}"] = mock_class
+
+        with patch.object(core, "collectors", collectors):
+            report = core.collect()
+
+        assert report.errors == []
+        assert list(report.results) == list(collectors)
+
+    def test_collect_builds_fresh_collectors_each_run(self):
+        """Test that every collect() instantiates its collectors anew."""
+        core = SnailCore()
+        mock_class = MagicMock()
+        mock_class.return_value.collect.return_value = {}
+
+        with patch.object(core, "collectors", {"fresh": mock_class}):
+            core.collect()
+            core.collect()
+
+        assert mock_class.call_count == 2
+
     def test_collect_with_invalid_collector_names(self):
         """Test collection with invalid collector names (should be ignored)."""
         core = SnailCore()
@@ -274,6 +331,9 @@ class TestCollectionReport:
         assert data["meta"]["snail_version"] == snail_version
         assert data["data"] == results
         assert data["errors"] == errors
+        # Shallow view: payloads are shared with the report, not copied
+        assert data["data"] is report.results
+        assert data["errors"] is report.errors
 
     def test_to_json(self):
         """Test CollectionReport.to_json() method."""
@@ -299,9 +359,73 @@ class TestCollectionReport:
         assert isinstance(json_str, str)
 
         # Should be valid JSON
-        import json
-
         data = json.loads(json_str)
         assert "meta" in data
         assert "data" in data
         assert "errors" in data
+
+    def test_to_json_bytes_matches_stdlib_encoding(self):
+        """Test to_json_bytes() decodes the same as json.dumps, with or without orjson."""
+        report = CollectionReport(
+            hostname="hôte-test",
+            host_id="test-host-id",
+            collection_id=str(uuid4()),
+            timestamp="2024-01-01T00:00:00Z",
+            snail_version="0.1.0",
+            results={
+                "test": {
+                    1: "int key",
+                    "path": Path("/tmp"),
+                    "boot_time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    "description": "Überprüfung ✓",
+                }
+            },
+        )
+        expected = json.loads(json.dumps(report.to_dict(), default=str))
+
+        assert json.loads(report.to_json_bytes()) == expected
+        with patch("snail_core.core.orjson", None):
+            assert json.loads(report.to_json_bytes()) == expected
+
+        # Integers wider than 64 bits are beyond orjson; the stdlib takes over
+        report.results["big"] = 2**70
+        assert json.loads(report.to_json_bytes())["data"]["big"] == 2**70
+
+        # NaN is the documented difference: orjson encodes it as null
+        del report.results["big"]
+        report.results["load"] = float("nan")
+        if core_module.orjson is not None:
+            assert json.loads(report.to_json_bytes())["data"]["load"] is None
+        with patch("snail_core.core.orjson", None):
+            assert math.isnan(json.loads(report.to_json_bytes())["data"]["load"])
+
+    def test_to_json_uses_stdlib_encoding(self):
+        """Test to_json() escapes non-ASCII and keeps NaN, exactly like json.dumps."""
+        report = CollectionReport(
+            hostname="hôte-test",
+            host_id="test-host-id",
+            collection_id=str(uuid4()),
+            timestamp="2024-01-01T00:00:00Z",
+            snail_version="0.1.0",
+            results={"test": {"description": "Überprüfung ✓", "load": float("nan")}},
+        )
+
+        json_str = report.to_json()
+
+        assert json_str == json.dumps(report.to_dict(), indent=2, default=str)
+        assert "\\u00f4" in json_str
+        assert '"load": NaN' in json_str
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_collection_report_uses_slots(self):
+        """Test that reports are slotted and reject unknown attributes."""
+        report = CollectionReport(
+            hostname="test-host",
+            host_id="test-host-id",
+            collection_id=str(uuid4()),
+            timestamp="2024-01-01T00:00:00Z",
+            snail_version="0.1.0",
+        )
+        assert not hasattr(report, "__dict__")
+        with pytest.raises(AttributeError):
+            report.unknown_field = "value"
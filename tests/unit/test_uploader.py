@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import gzip
 import json
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -50,6 +51,14 @@ class TestUploadResult(unittest.TestCase):
         assert result.attempts == 1
         assert result.duration_ms == 0.0
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need 3.10+")
+    def test_upload_result_uses_slots(self):
+        """Test that UploadResult instances are slotted."""
+        result = UploadResult(success=True)
+        assert not hasattr(result, "__dict__")
+        with self.assertRaises(AttributeError):
+            result.unknown_field = "value"
+
 
 class TestUploaderInitialization(unittest.TestCase):
     """Test Uploader class initialization."""
@@ -97,6 +106,37 @@ class TestUploaderInitialization(unittest.TestCase):
         assert uploader.session.headers["Content-Type"] == "application/json"
         assert uploader.session.headers["Accept"] == "application/json"
 
+    def test_init_shares_connection_pool_not_headers(self):
+        """Test that uploaders share one connection pool but keep their own auth."""
+        first = Uploader(Config(upload_url="https://test.com/api", api_key="key-1"))
+        second = Uploader(Config(upload_url="https://test.com/api", api_key="key-2"))
+
+        assert first.session is not second.session
+        assert first.session.get_adapter("https://test.com") is second.session.get_adapter(
+            "https://test.com"
+        )
+        assert first.session.headers["X-API-Key"] == "key-1"
+        assert second.session.headers["X-API-Key"] == "key-2"
+
+    def test_close_closes_session(self):
+        """Test that close() releases the uploader's session."""
+        uploader = Uploader(Config(upload_url="https://test.com/api"))
+        with patch.object(uploader.session, "close") as mock_close:
+            uploader.close()
+        mock_close.assert_called_once_with()
+
+    def test_close_keeps_shared_pool_open(self):
+        """Test that closing one uploader doesn't close the pool other uploaders use."""
+        closed = Uploader(Config(upload_url="https://test.com/api"))
+        other = Uploader(Config(upload_url="https://test.com/api"))
+        adapter = other.session.get_adapter("https://test.com")
+
+        with patch.object(adapter, "close") as mock_close:
+            closed.close()
+
+        mock_close.assert_not_called()
+        assert other.session.get_adapter("https://test.com") is adapter
+
     def test_get_version(self):
         """Test version detection."""
         config = Config(upload_url="https://test.com/api")
@@ -172,6 +212,17 @@ class TestUploaderUpload(unittest.TestCase):
             headers = call_args[1]["headers"]
             assert headers["Content-Encoding"] == "gzip"
 
+    def test_compressed_body_is_deterministic(self):
+        """Test that compressing the same report twice yields identical bytes."""
+        uploader = Uploader(Config(upload_url="https://test.com/api", compress_output=True))
+        report = self.create_test_report()
+
+        first, _ = uploader._serialize(report)
+        second, _ = uploader._serialize(report)
+
+        assert first == second
+        assert first[4:8] == b"\x00\x00\x00\x00"  # gzip header MTIME field
+
     def test_upload_without_compression(self):
         """Test upload with compression disabled."""
         config = Config(
@@ -274,6 +325,27 @@ class TestUploaderUpload(unittest.TestCase):
             assert "timestamp" in meta
             assert "snail_version" in meta
 
+    def test_upload_serializes_once_across_retries(self):
+        """Test that retries resend the bytes serialized for the first attempt."""
+        config = Config(upload_url="https://test.com/api", api_key="test-key", upload_retries=3)
+        uploader = Uploader(config)
+        report = self.create_test_report()
+
+        failure = MagicMock(ok=False, status_code=500, text="Server Error")
+        success = MagicMock(ok=True, status_code=200)
+        success.json.return_value = {"status": "ok"}
+
+        with (
+            patch.object(uploader, "_serialize", wraps=uploader._serialize) as mock_serialize,
+            patch.object(uploader.session, "post", side_effect=[failure, success]) as mock_post,
+            patch("snail_core.uploader.time.sleep"),
+        ):
+            uploader.upload(report)
+
+        mock_serialize.assert_called_once_with(report)
+        first, second = (c.kwargs["data"] for c in mock_post.call_args_list)
+        assert first is second
+
 
 class TestUploaderRetryLogic(unittest.TestCase):
     """Test Uploader retry logic."""